@@ -40,6 +40,9 @@ class AdaptiveExecutor:
     - Process health checking and recovery
     """
 
+    # Hard cap on container startup before falling back to a local process.
+    CONTAINER_START_TIMEOUT_SEC = 10.0
+
     def __init__(self, registry: SecureRegistry, container_engine: Optional[ContainerEngine] = None):
         """
         Initialize the adaptive executor.
@@ -93,7 +96,8 @@ class AdaptiveExecutor:
 
             # Choose execution method based on deployment type
             deployment_raw = ((bot.get("deployment_config") or {}).get("deployment_type") or "local_process")
-            deployment_raw = str(deployment_raw).lower()
+            # str() of a DeploymentType member is "DeploymentType.X"; compare on its value.
+            deployment_raw = str(getattr(deployment_raw, "value", deployment_raw)).lower()
             if deployment_raw in {"custom_container", "container"}:
                 try:
                     success = await self._run_bot_in_container(bot, script_path)
@@ -243,7 +247,7 @@ class AdaptiveExecutor:
             try:
                 success = await asyncio.wait_for(
                     self.container_engine.start_container(container_name),
-                    timeout=10,
+                    timeout=self.CONTAINER_START_TIMEOUT_SEC,
                 )
             except asyncio.TimeoutError as te:
                 # Best-effort cleanup: attempt stop/remove if startup is hung.
@@ -1,8 +1,9 @@
 """Bot registry with atomic operations and caching."""
 import logging
+from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import os
 
 from enum import Enum
 
@@ -60,6 +61,16 @@ class BotStatus(str, Enum):
     ERROR = "error"
 
 
+_FAILED_STATUSES = frozenset({BotStatus.ERROR.value, BotStatus.FAILED.value})
+
+
+def _stats_key(bot: Dict[str, Any]) -> Tuple[str, bool]:
+    """(normalized status, counts-as-failed) for one bot record."""
+    status_val = str(bot.get("status", "")).lower()
+    failed = status_val in _FAILED_STATUSES or bool(bot.get("error") or bot.get("error_message"))
+    return status_val, failed
+
+
 class SecureRegistry:
     """Manages bot registry with atomic writes and caching.
 
@@ -73,6 +84,10 @@ class SecureRegistry:
     def __init__(self, registry_file: str = None):
         self.file = registry_file or settings.REGISTRY_FILE
         self._cache: Dict[str, Dict[str, Any]] = {}
+        # Stats counters, kept in step with `_cache` on every mutation so that
+        # get_registry_stats() doesn't rescan all bots.
+        self._status_counts: Counter = Counter()
+        self._failed_count = 0
         self._load_initial_data()
 
     def _load_initial_data(self) -> None:
@@ -92,15 +107,41 @@ class SecureRegistry:
         except Exception as e:
             logger.error(f"Failed to load registry from {self.file}: {e}")
             self._cache = {}
+        self._recount_stats()
+
+    def _count(self, bot: Dict[str, Any], delta: int) -> None:
+        status_val, failed = _stats_key(bot)
+        if status_val:
+            self._status_counts[status_val] += delta
+        if failed:
+            self._failed_count += delta
+
+    def _recount_stats(self) -> None:
+        """Rebuild the stats counters from scratch (after bulk changes to `_cache`)."""
+        self._status_counts = Counter()
+        self._failed_count = 0
+        for b in self._cache.values():
+            self._count(b, 1)
+
+    def _put(self, bot_id: str, bot: Dict[str, Any]) -> None:
+        old = self._cache.get(bot_id)
+        if old is not None:
+            self._count(old, -1)
+        self._cache[bot_id] = bot
+        self._count(bot, 1)
 
     def _save(self) -> None:
         """Save current cache to disk atomically."""
         try:
+            try:
+                last_updated = os.stat(self.file).st_mtime
+            except FileNotFoundError:
+                last_updated = None
             data = {
                 "bots": [dict(bot) for bot in self._cache.values()],
                 "metadata": {
                     "total_bots": len(self._cache),
-                    "last_updated": Path(self.file).stat().st_mtime if Path(self.file).exists() else None,
+                    "last_updated": last_updated,
                 },
             }
             atomic_save_json(self.file, data)
@@ -112,6 +153,10 @@ class SecureRegistry:
         """Get all registered bots."""
         return [BotRecord(dict(b)) for b in self._cache.values()]
 
+    def get_all_bots_as_dicts(self) -> List[Dict[str, Any]]:
+        """Get all registered bots as plain dicts (shallow copies, safe to mutate)."""
+        return [dict(b) for b in self._cache.values()]
+
     def get_bot_by_id(self, bot_id: str) -> Optional[BotRecord]:
         """Retrieve a bot by its ID."""
         bot = self._cache.get(bot_id)
@@ -142,7 +187,7 @@ class SecureRegistry:
         if bot_id in self._cache:
             raise ValueError(f"Bot with ID '{bot_id}' already exists")
 
-        self._cache[bot_id] = _normalize_for_json(dict(bot_d))
+        self._put(bot_id, _normalize_for_json(dict(bot_d)))
         self._save()
         logger.info("Registered bot: %s (ID: %s)", self._cache[bot_id].get("name"), bot_id)
         return dict(self._cache[bot_id])
@@ -156,7 +201,7 @@ class SecureRegistry:
         if bot_id not in self._cache:
             raise ValueError(f"Bot with ID '{bot_id}' not found in registry")
 
-        self._cache[bot_id] = _normalize_for_json(dict(bot_d))
+        self._put(bot_id, _normalize_for_json(dict(bot_d)))
         self._save()
         logger.info(
             "Updated bot: %s (ID: %s), status: %s",
@@ -166,6 +211,26 @@ class SecureRegistry:
         )
         return dict(self._cache[bot_id])
 
+    def update_bots(self, bots: List[Any]) -> List[Dict[str, Any]]:
+        """Update several existing bots with a single registry write."""
+        updated: Dict[str, Dict[str, Any]] = {}
+        for bot in bots:
+            bot_d = _as_dict(bot)
+            bot_id = str(bot_d.get("id", "")).strip()
+            if not bot_id:
+                raise ValueError("Bot must include non-empty 'id'")
+            if bot_id not in self._cache:
+                raise ValueError(f"Bot with ID '{bot_id}' not found in registry")
+            updated[bot_id] = _normalize_for_json(dict(bot_d))
+
+        if not updated:
+            return []
+        for bot_id, bot_d in updated.items():
+            self._put(bot_id, bot_d)
+        self._save()
+        logger.info("Updated %d bots: %s", len(updated), ", ".join(updated))
+        return [dict(b) for b in updated.values()]
+
     def update_bot_status(self, bot_id: str, status: BotStatus, **kwargs) -> Optional[Dict[str, Any]]:
         """Update only the status of a bot."""
         bot = self._cache.get(bot_id)
@@ -173,9 +238,11 @@ class SecureRegistry:
             logger.warning("Attempted to update non-existent bot: %s", bot_id)
             return None
 
+        self._count(bot, -1)
         bot["status"] = status.value if isinstance(status, Enum) else str(status)
         for key, value in kwargs.items():
             bot[key] = value
+        self._count(bot, 1)
 
         self._save()
         logger.info("Updated bot %s status to %s", bot_id, bot.get("status"))
@@ -188,41 +255,25 @@ class SecureRegistry:
             return False
 
         bot_name = self._cache[bot_id].get("name")
-        del self._cache[bot_id]
+        self._count(self._cache.pop(bot_id), -1)
         self._save()
         logger.info("Unregistered bot: %s (ID: %s)", bot_name, bot_id)
         return True
 
     def get_registry_stats(self) -> Dict[str, Any]:
         """Get statistics about the current registry."""
-        bots_by_status: Dict[str, int] = {}
-        active_bots = 0
-        failed_bots = 0
-
-        for b in self._cache.values():
-            status_val = str(b.get("status", "")).lower()
-            if status_val:
-                bots_by_status[status_val] = bots_by_status.get(status_val, 0) + 1
-            if status_val == BotStatus.RUNNING.value:
-                active_bots += 1
-            if (
-                status_val in {BotStatus.ERROR.value, "error", BotStatus.FAILED.value}
-                or b.get("error")
-                or b.get("error_message")
-            ):
-                failed_bots += 1
-
         return {
             "total_bots": len(self._cache),
-            "bots_by_status": bots_by_status,
-            "active_bots": active_bots,
-            "failed_bots": failed_bots,
+            "bots_by_status": {k: v for k, v in self._status_counts.items() if v > 0},
+            "active_bots": self._status_counts[BotStatus.RUNNING.value],
+            "failed_bots": self._failed_count,
         }
 
     def clear_registry(self) -> None:
         """Clear all bots from the registry (WARNING: destructive operation)."""
         logger.warning("Clearing entire bot registry!")
         self._cache.clear()
+        self._recount_stats()
         self._save()
 
     def export_registry(self, filepath: str) -> bool:
@@ -258,6 +309,7 @@ class SecureRegistry:
             else:
                 self._cache = dict(imported_bots)
                 logger.info("Replaced registry with %d bots from: %s", len(imported_bots), filepath)
+            self._recount_stats()
 
             self._save()
             return True
@@ -98,6 +98,9 @@ class Settings:
     # API Settings
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
+    # uvicorn worker processes when DEBUG is off; 0 = auto (2 * CPUs + 1).
+    # Each worker runs its own supervisor and in-memory registry, hence the default of 1.
+    API_WORKERS: int = 1
     API_SECRET_KEY: SecretValue = field(
         default_factory=lambda: SecretValue("CHANGE_THIS_IN_PRODUCTION")
     )
@@ -225,6 +228,7 @@ def get_settings() -> Settings:
 
         API_HOST=_env_str("API_HOST", default.API_HOST),
         API_PORT=_env_int("API_PORT", default.API_PORT),
+        API_WORKERS=_env_int("API_WORKERS", default.API_WORKERS),
         API_SECRET_KEY=_as_secret(_env_str("API_SECRET_KEY", default.API_SECRET_KEY.get_secret_value())),
         API_ALGORITHM=_env_str("API_ALGORITHM", default.API_ALGORITHM),
         API_ACCESS_TOKEN_EXPIRE_MINUTES=_env_int(
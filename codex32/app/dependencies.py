@@ -12,6 +12,7 @@ from functools import lru_cache
 from app.bot_registry import SecureRegistry
 from app.adaptive_executor import AdaptiveExecutor
 from app.container_engine import get_engine
+from app.self_enhancement import PatchStore
 
 
 @lru_cache(maxsize=1)
@@ -26,3 +27,9 @@ def get_executor() -> AdaptiveExecutor:
     registry = get_registry()
     engine = get_engine()
     return AdaptiveExecutor(registry=registry, container_engine=engine)
+
+
+@lru_cache(maxsize=1)
+def get_patch_store() -> PatchStore:
+    """Return a process-wide PatchStore, so its in-memory index outlives a request."""
+    return PatchStore()
@@ -0,0 +1,111 @@
+"""Memoized callable introspection for FastAPI dependency resolution.
+
+FastAPI's `solve_dependencies` re-checks every endpoint dependency on every
+request (`is_gen_callable`, `is_async_gen_callable`, `is_coroutine_callable`),
+and `get_dependant` re-derives typed signatures each time a route is built. The
+answers never change for a given callable, so this module caches them in weak
+maps and patches FastAPI's helpers to consult the cache.
+
+Call `apply_patch()` before routes are built and `prime_routes(app.routes)` at
+startup so the first requests don't pay for the introspection either.
+"""
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+from weakref import WeakKeyDictionary
+
+from fastapi.dependencies import utils as dep_utils
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute, APIWebSocketRoute
+
+_orig_get_typed_signature = dep_utils.get_typed_signature
+_orig_is_coroutine_callable = dep_utils.is_coroutine_callable
+_orig_is_async_gen_callable = dep_utils.is_async_gen_callable
+_orig_is_gen_callable = dep_utils.is_gen_callable
+
+
+@dataclass(frozen=True, slots=True)
+class CallableInfo:
+    """Kind flags FastAPI needs to decide how to invoke a dependency."""
+
+    is_coroutine: bool
+    is_async_gen: bool
+    is_gen: bool
+
+
+_info_cache: "WeakKeyDictionary[Callable[..., Any], CallableInfo]" = WeakKeyDictionary()
+_signature_cache: "WeakKeyDictionary[Callable[..., Any], inspect.Signature]" = WeakKeyDictionary()
+
+
+def _compute_info(call: Callable[..., Any]) -> CallableInfo:
+    return CallableInfo(
+        is_coroutine=_orig_is_coroutine_callable(call),
+        is_async_gen=_orig_is_async_gen_callable(call),
+        is_gen=_orig_is_gen_callable(call),
+    )
+
+
+def callable_info(call: Callable[..., Any]) -> CallableInfo:
+    """Return the cached kind flags for `call`, computing them on first use."""
+    try:
+        return _info_cache[call]
+    except KeyError:
+        info = _info_cache[call] = _compute_info(call)
+        return info
+    except TypeError:
+        # Unhashable or not weak-referenceable (e.g. some callable instances).
+        return _compute_info(call)
+
+
+def get_typed_signature(call: Callable[..., Any]) -> inspect.Signature:
+    try:
+        return _signature_cache[call]
+    except KeyError:
+        sig = _signature_cache[call] = _orig_get_typed_signature(call)
+        return sig
+    except TypeError:
+        return _orig_get_typed_signature(call)
+
+
+def is_coroutine_callable(call: Callable[..., Any]) -> bool:
+    return callable_info(call).is_coroutine
+
+
+def is_async_gen_callable(call: Callable[..., Any]) -> bool:
+    return callable_info(call).is_async_gen
+
+
+def is_gen_callable(call: Callable[..., Any]) -> bool:
+    return callable_info(call).is_gen
+
+
+def apply_patch() -> None:
+    """Route FastAPI's introspection helpers through the cache (idempotent)."""
+    dep_utils.get_typed_signature = get_typed_signature
+    dep_utils.is_coroutine_callable = is_coroutine_callable
+    dep_utils.is_async_gen_callable = is_async_gen_callable
+    dep_utils.is_gen_callable = is_gen_callable
+
+
+def _prime_dependant(dependant: Dependant) -> None:
+    if dependant.call is not None:
+        callable_info(dependant.call)
+    for sub in dependant.dependencies:
+        _prime_dependant(sub)
+
+
+def prime_routes(routes: Iterable[Any]) -> int:
+    """Warm the cache for every endpoint and dependency in `routes`.
+
+    Returns:
+        Number of routes primed
+    """
+    primed = 0
+    for route in routes:
+        dependant: Optional[Dependant] = getattr(route, "dependant", None)
+        if isinstance(route, (APIRoute, APIWebSocketRoute)) and dependant is not None:
+            _prime_dependant(dependant)
+            primed += 1
+    return primed
@@ -5,6 +5,7 @@ Converts natural language descriptions into fully functional bots without requir
 
 import json
 import asyncio
+import re
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -25,6 +26,11 @@ class BotRequirements:
     special_features: List[str]  # Error handling, logging, monitoring, etc.
 
 
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile substring keywords into one alternation (a single C-level scan per check)."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
 class NLPBotInterpreter:
     """Convert natural language to bot specifications."""
 
@@ -46,6 +52,35 @@ class NLPBotInterpreter:
         'manual': ['manual', 'on-demand', 'button', 'command', 'user'],
     }
 
+    ADVANCED_WORDS = ['machine learning', 'ml', 'ai', 'complex', 'advanced', 'neural', 'model']
+    MODERATE_WORDS = ['database', 'api', 'multiple', 'filter', 'sort']
+
+    FEATURE_KEYWORDS = {
+        'error_handling': ['error', 'fail', 'retry', 'exception'],
+        'logging': ['log', 'debug', 'track', 'record'],
+        'notification': ['notify', 'alert', 'email', 'message'],
+        'caching': ['cache', 'fast', 'optimize', 'performance'],
+        'database': ['database', 'db', 'store', 'sql'],
+        'api': ['api', 'rest', 'http', 'endpoint'],
+        'scheduling': ['schedule', 'time', 'cron', 'interval'],
+    }
+
+    IO_KEYWORDS = {
+        'json': ['json', 'api', 'request'],
+        'csv': ['csv', 'data', 'file', 'spreadsheet'],
+        'text': ['text', 'string', 'document', 'content'],
+        'image': ['image', 'photo', 'picture', 'visual'],
+        'database': ['database', 'db', 'sql', 'record'],
+    }
+
+    # Keyword tables compiled once at class creation; dict order is the match priority.
+    _TASK_PATTERNS = [(k, _keyword_pattern(v)) for k, v in TASK_KEYWORDS.items()]
+    _FREQUENCY_PATTERNS = [(k, _keyword_pattern(v)) for k, v in FREQUENCY_KEYWORDS.items()]
+    _ADVANCED_PATTERN = _keyword_pattern(ADVANCED_WORDS)
+    _MODERATE_PATTERN = _keyword_pattern(MODERATE_WORDS)
+    _FEATURE_PATTERNS = [(k, _keyword_pattern(v)) for k, v in FEATURE_KEYWORDS.items()]
+    _IO_PATTERNS = [(k, _keyword_pattern(v)) for k, v in IO_KEYWORDS.items()]
+
     async def interpret(self, description: str) -> BotRequirements:
         """Convert natural language to bot requirements."""
         description_lower = description.lower()
@@ -82,63 +117,37 @@ class NLPBotInterpreter:
 
     def _detect_task_type(self, text: str) -> str:
         """Detect what type of task the bot performs."""
-        for task, keywords in self.TASK_KEYWORDS.items():
-            if any(keyword in text for keyword in keywords):
+        for task, pattern in self._TASK_PATTERNS:
+            if pattern.search(text):
                 return task
         return 'process'  # Default
 
     def _detect_frequency(self, text: str) -> str:
         """Detect how often bot runs."""
-        for freq, keywords in self.FREQUENCY_KEYWORDS.items():
-            if any(keyword in text for keyword in keywords):
+        for freq, pattern in self._FREQUENCY_PATTERNS:
+            if pattern.search(text):
                 return freq
         return 'triggered'  # Default
 
     def _detect_complexity(self, text: str) -> str:
         """Detect complexity level."""
-        advanced_words = ['machine learning', 'ml', 'ai', 'complex', 'advanced', 'neural', 'model']
-        moderate_words = ['database', 'api', 'multiple', 'filter', 'sort']
-
-        if any(word in text for word in advanced_words):
+        if self._ADVANCED_PATTERN.search(text):
             return 'advanced'
-        elif any(word in text for word in moderate_words):
+        elif self._MODERATE_PATTERN.search(text):
             return 'moderate'
         return 'simple'
 
     def _detect_features(self, text: str) -> List[str]:
         """Detect special features needed."""
-        features = []
-        feature_keywords = {
-            'error_handling': ['error', 'fail', 'retry', 'exception'],
-            'logging': ['log', 'debug', 'track', 'record'],
-            'notification': ['notify', 'alert', 'email', 'message'],
-            'caching': ['cache', 'fast', 'optimize', 'performance'],
-            'database': ['database', 'db', 'store', 'sql'],
-            'api': ['api', 'rest', 'http', 'endpoint'],
-            'scheduling': ['schedule', 'time', 'cron', 'interval'],
-        }
-
-        for feature, keywords in feature_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                features.append(feature)
-
-        return features
+        return [feature for feature, pattern in self._FEATURE_PATTERNS if pattern.search(text)]
 
     def _detect_io_types(self, text: str, task_type: str) -> Tuple[str, str]:
         """Detect input and output types."""
-        io_keywords = {
-            'json': ['json', 'api', 'request'],
-            'csv': ['csv', 'data', 'file', 'spreadsheet'],
-            'text': ['text', 'string', 'document', 'content'],
-            'image': ['image', 'photo', 'picture', 'visual'],
-            'database': ['database', 'db', 'sql', 'record'],
-        }
-
         input_type = 'json'  # Default
         output_type = 'json'  # Default
 
-        for io, keywords in io_keywords.items():
-            if any(keyword in text for keyword in keywords):
+        for io, pattern in self._IO_PATTERNS:
+            if pattern.search(text):
                 if input_type == 'json':
                     input_type = io
                 output_type = io
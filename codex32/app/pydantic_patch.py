@@ -15,9 +15,18 @@ from pydantic import schema as pydantic_schema
 from pydantic.fields import FieldInfo, ModelField, Undefined, UndefinedType
 
 
+_PATCHED = False
+
+
 def apply_patch() -> None:
-    """Apply the compatibility patch once."""
+    """Apply the compatibility patch once per process."""
+    global _PATCHED
+    if _PATCHED:
+        return
+    # Also covers a patch applied by another copy of this module (e.g. imported
+    # under a different name).
     if getattr(ModelField._set_default_and_type, "__patched_for_py314__", False):
+        _PATCHED = True
         return
 
     def _patched_set_default_and_type(self: ModelField) -> None:
@@ -76,6 +85,9 @@ def apply_patch() -> None:
         return annotation
 
     pydantic_schema.get_annotation_from_field_info = _patched_get_annotation_from_field_info  # type: ignore[assignment]
+    # Only once every assignment above has succeeded: a failure part-way through
+    # must leave later calls free to retry rather than skip a half-applied patch.
+    _PATCHED = True
 
 
 # Patch eagerly on import for all callers.
@@ -216,7 +216,7 @@ def status(
         },
         "supervisor": {
             "enabled": bool(supervisor),
-            "incidents_count": len(supervisor.incidents) if supervisor else 0,
+            "incidents_count": len(supervisor.incidents.tail()) if supervisor else 0,
         },
         "recommendations": recommendations,
         "helpful_links": {
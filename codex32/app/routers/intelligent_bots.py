@@ -6,14 +6,31 @@ Provides REST API for creating bots from natural language descriptions.
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
 from typing import Dict, List, Any
+from functools import lru_cache
 from pathlib import Path
 import logging
 import json
-from ..intelligent_bot_builder import create_bot_from_natural_language
+from ..intelligent_bot_builder import create_bot_from_natural_language, NLPBotInterpreter
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/intelligent-bots", tags=["intelligent-bots"])
 
+# The interpreter is stateless; build it once at import instead of per request.
+_INTERPRETER = NLPBotInterpreter()
+
+
+@lru_cache(maxsize=1)
+def _load_dashboard_ui() -> str:
+    """Read the dashboard HTML once; it ships with the package and doesn't change."""
+    try:
+        return (Path(__file__).parent / "dashboard_ui.html").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return """
+        <h1>Dashboard Not Found</h1>
+        <p>The intelligent dashboard UI could not be found.</p>
+        <p><a href="/docs">View API Documentation</a></p>
+        """
+
 
 @router.get("/dashboard", response_class=HTMLResponse)
 async def get_intelligent_dashboard():
@@ -21,15 +38,7 @@ async def get_intelligent_dashboard():
     Serve the intelligent bot builder dashboard.
     Modern, user-friendly interface for bot creation without coding.
     """
-    dashboard_file = Path(__file__).parent / "dashboard_ui.html"
-    if dashboard_file.exists():
-        return dashboard_file.read_text()
-    else:
-        return """
-        <h1>Dashboard Not Found</h1>
-        <p>The intelligent dashboard UI could not be found.</p>
-        <p><a href="/docs">View API Documentation</a></p>
-        """
+    return _load_dashboard_ui()
 
 
 
@@ -248,10 +257,7 @@ async def test_bot_description(request_body: Dict[str, Any]) -> Dict[str, Any]:
                 content={"success": False, "error": "description is required"}
             )
 
-        from ..intelligent_bot_builder import NLPBotInterpreter
-
-        interpreter = NLPBotInterpreter()
-        requirements = await interpreter.interpret(description)
+        requirements = await _INTERPRETER.interpret(description)
 
         return {
             "success": True,
@@ -8,15 +8,18 @@ Design goals:
 
 from __future__ import annotations
 
+from operator import attrgetter, itemgetter
 from typing import Optional, List
 
 from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi.responses import Response
 
 from app.config import settings
-from app.dependencies import get_registry, get_executor
+from app.dependencies import get_registry, get_executor, get_patch_store
 from app.bot_registry import SecureRegistry
 from app.adaptive_executor import AdaptiveExecutor
 from app.supervisor import get_supervisor
+from app.utils import json_dumps
 from app.self_enhancement import (
     PatchStore,
     propose_patch,
@@ -28,6 +31,29 @@ from app.self_enhancement import (
 
 router = APIRouter(prefix="/api/v1/self", tags=["self"])
 
+# Response field order for patch proposals; attrgetter fetches them all in one C call.
+_PATCH_KEYS = (
+    "proposal_id",
+    "title",
+    "goal",
+    "created_at",
+    "status",
+    "diff",
+    "rationale",
+    "risks",
+    "tests",
+    "approved_at",
+    "applied_at",
+    "rejected_at",
+    "reviewer",
+)
+_PATCH_GET = attrgetter(*_PATCH_KEYS)
+_SUMMARY_KEYS = ("proposal_id", "title", "goal", "status", "created_at")
+_SUMMARY_GET = itemgetter(*_SUMMARY_KEYS)
+
+# Upper bound on incidents returned per request, to bound worst-case read/parse cost.
+MAX_INCIDENTS_LIMIT = 1000
+
 
 def _require_admin(api_key: Optional[str]) -> None:
     if not api_key or api_key != settings.ADMIN_API_KEY.get_secret_value():
@@ -75,27 +101,26 @@ def recent_incidents(limit: int = 200) -> list:
     supervisor = get_supervisor()
     if not supervisor:
         return []
-    return supervisor.incidents.tail(limit=limit)
+    return supervisor.incidents.tail(limit=min(limit, MAX_INCIDENTS_LIMIT))
 
 
-@router.get("/patches")
-def list_patches(x_admin_api_key: Optional[str] = Header(default=None)) -> dict:
+# response_model documents the JSON body in OpenAPI; returning a Response skips its
+# validation, so the pre-serialized fast path below is unaffected.
+@router.get("/patches", response_model=dict)
+def list_patches(
+    x_admin_api_key: Optional[str] = Header(default=None),
+    store: PatchStore = Depends(get_patch_store),
+) -> Response:
     _require_admin(x_admin_api_key)
-    store = PatchStore()
-    proposals = store.list()
-    return {
+    # Summaries only need a few fields; read them off the stored dicts directly.
+    proposals = store.list_raw()
+    # Serialize straight to bytes: the summaries are plain JSON types, so FastAPI's
+    # jsonable_encoder walk over every proposal is pure overhead here.
+    body = json_dumps({
         "count": len(proposals),
-        "proposals": [
-            {
-                "proposal_id": p.proposal_id,
-                "title": p.title,
-                "goal": p.goal,
-                "status": p.status,
-                "created_at": p.created_at,
-            }
-            for p in proposals
-        ],
-    }
+        "proposals": [dict(zip(_SUMMARY_KEYS, _SUMMARY_GET(p))) for p in proposals],
+    })
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/patches/propose", status_code=status.HTTP_201_CREATED)
@@ -107,6 +132,7 @@ def propose(
     risks: Optional[List[str]] = None,
     tests: Optional[List[str]] = None,
     x_admin_api_key: Optional[str] = Header(default=None),
+    store: PatchStore = Depends(get_patch_store),
 ) -> dict:
     _require_admin(x_admin_api_key)
 
@@ -118,15 +144,17 @@ def propose(
         risks=risks or [],
         tests=tests or [],
     )
-    store = PatchStore()
     store.add(proposal)
     return asdict_safe(proposal)
 
 
 @router.get("/patches/{proposal_id}")
-def get_patch(proposal_id: str, x_admin_api_key: Optional[str] = Header(default=None)) -> dict:
+def get_patch(
+    proposal_id: str,
+    x_admin_api_key: Optional[str] = Header(default=None),
+    store: PatchStore = Depends(get_patch_store),
+) -> dict:
     _require_admin(x_admin_api_key)
-    store = PatchStore()
     p = store.get(proposal_id)
     if not p:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Proposal not found")
@@ -138,9 +166,9 @@ def approve_patch(
     proposal_id: str,
     reviewer: str = "admin",
     x_admin_api_key: Optional[str] = Header(default=None),
+    store: PatchStore = Depends(get_patch_store),
 ) -> dict:
     _require_admin(x_admin_api_key)
-    store = PatchStore()
     try:
         p = approve_proposal(store, proposal_id=proposal_id, reviewer=reviewer)
     except KeyError:
@@ -156,9 +184,9 @@ def reject_patch(
     reason: str,
     reviewer: str = "admin",
     x_admin_api_key: Optional[str] = Header(default=None),
+    store: PatchStore = Depends(get_patch_store),
 ) -> dict:
     _require_admin(x_admin_api_key)
-    store = PatchStore()
     try:
         p = reject_proposal(store, proposal_id=proposal_id, reviewer=reviewer, reason=reason)
     except KeyError:
@@ -173,9 +201,9 @@ def apply_patch(
     proposal_id: str,
     reviewer: str = "admin",
     x_admin_api_key: Optional[str] = Header(default=None),
+    store: PatchStore = Depends(get_patch_store),
 ) -> dict:
     _require_admin(x_admin_api_key)
-    store = PatchStore()
     try:
         p = apply_approved_proposal(store, proposal_id=proposal_id, reviewer=reviewer)
     except KeyError:
@@ -189,18 +217,4 @@ def apply_patch(
 
 def asdict_safe(p) -> dict:
     # avoid importing dataclasses in FastAPI response layer for minimal overhead
-    return {
-        "proposal_id": p.proposal_id,
-        "title": p.title,
-        "goal": p.goal,
-        "created_at": p.created_at,
-        "status": p.status,
-        "diff": p.diff,
-        "rationale": p.rationale,
-        "risks": p.risks,
-        "tests": p.tests,
-        "approved_at": p.approved_at,
-        "applied_at": p.applied_at,
-        "rejected_at": p.rejected_at,
-        "reviewer": p.reviewer,
-    }
+    return dict(zip(_PATCH_KEYS, _PATCH_GET(p)))
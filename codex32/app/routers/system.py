@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+import time
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Response
 
 from app.bot_registry import SecureRegistry
 from app.dependencies import get_registry
 
 router = APIRouter(prefix="/api/v1/system", tags=["system"])
 
+# Dashboards poll this endpoint several times a second; a 1s cache collapses
+# concurrent polls into a single registry scan.
+STATS_TTL_SEC = 1.0
+_stats_lock = Lock()
+_stats_cache: Optional[Tuple[SecureRegistry, float, Dict[str, Any]]] = None
+
 
 @router.get("/stats")
-def system_stats(registry: SecureRegistry = Depends(get_registry)) -> dict:
+def system_stats(response: Response, registry: SecureRegistry = Depends(get_registry)) -> dict:
+    global _stats_cache
+    with _stats_lock:
+        now = time.monotonic()
+        cached = _stats_cache
+        if cached is not None and cached[0] is registry and cached[1] > now:
+            stats = cached[2]
+        else:
+            stats = registry.get_registry_stats()
+            _stats_cache = (registry, now + STATS_TTL_SEC, stats)
+
+    response.headers["Cache-Control"] = f"max-age={int(STATS_TTL_SEC)}"
     return {
-        "registry": registry.get_registry_stats(),
+        "registry": stats,
     }
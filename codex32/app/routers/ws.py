@@ -1,7 +1,7 @@
 """WebSocket endpoints.
 
 Implements:
-- /ws/updates: broadcast-ish minimal feed (per-connection keepalive)
+- /ws/updates: broadcast-ish minimal feed (shared heartbeat broadcaster)
 - /ws/command/{user}: simple command channel echo for conversational integration
 
 These are intentionally minimal and safe: they don't execute arbitrary code.
@@ -10,28 +10,61 @@ These are intentionally minimal and safe: they don't execute arbitrary code.
 from __future__ import annotations
 
 import asyncio
-import json
-from datetime import datetime
-from app.utils import get_timestamp
+from typing import Optional, Set
+from app.utils import get_timestamp, json_dumps, json_loads
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 router = APIRouter()
 
+HEARTBEAT_INTERVAL_SEC = 5
+
+# Connected /ws/updates clients. A single broadcaster task serializes each heartbeat
+# once per tick and fans it out, instead of one sleeping loop per connection.
+_clients: Set[WebSocket] = set()
+_broadcaster: Optional[asyncio.Task] = None
+
+# Heartbeats differ only in "ts" (an ISO timestamp, never needs escaping), so splice
+# it into a pre-serialized template instead of building and encoding a dict per tick.
+_HB_PREFIX = '{"type":"heartbeat","ts":"'
+_HB_SUFFIX = '"}'
+
+
+def _heartbeat_message() -> str:
+    return _HB_PREFIX + get_timestamp() + _HB_SUFFIX
+
+
+async def _broadcast_heartbeats() -> None:
+    # Exits once the last client disconnects; the next connection restarts it.
+    while _clients:
+        msg = _heartbeat_message()
+        await asyncio.gather(*(ws.send_text(msg) for ws in list(_clients)), return_exceptions=True)
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SEC)
+
+
+def _ensure_broadcaster() -> None:
+    global _broadcaster
+    if _broadcaster is None or _broadcaster.done():
+        _broadcaster = asyncio.create_task(_broadcast_heartbeats())
+
 
 @router.websocket("/ws/updates")
 async def ws_updates(websocket: WebSocket) -> None:
     await websocket.accept()
     try:
+        # Keepalive heartbeat; clients can treat these as liveness pings.
+        await websocket.send_text(_heartbeat_message())
+        _clients.add(websocket)
+        _ensure_broadcaster()
+        # Park until the client goes away; inbound messages are ignored.
         while True:
-            # Keepalive heartbeat; clients can treat these as liveness pings.
-            await websocket.send_json({
-                "type": "heartbeat",
-                "ts": get_timestamp(),
-            })
-            await asyncio.sleep(5)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
     except WebSocketDisconnect:
         return
+    finally:
+        _clients.discard(websocket)
 
 
 @router.websocket("/ws/command/{user_id}")
@@ -39,18 +72,33 @@ async def ws_command(websocket: WebSocket, user_id: str) -> None:
     await websocket.accept()
     try:
         while True:
-            raw = await websocket.receive_text()
-            try:
-                payload = json.loads(raw)
-            except Exception:
-                payload = {"message": raw}
-
-            # Safe default: echo with metadata.
-            await websocket.send_json({
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            # Parse the frame as received (text or binary) to skip a decode/encode roundtrip.
+            binary = message.get("text") is None
+            raw = (message.get("bytes") or b"") if binary else message["text"]
+
+            payload = None
+            # Only attempt a parse when the frame looks like a JSON object/array.
+            if raw.lstrip()[:1] in ((b"{", b"[") if binary else ("{", "[")):
+                try:
+                    payload = json_loads(raw)
+                except ValueError:
+                    payload = None
+            if payload is None:
+                payload = {"message": raw.decode(errors="replace") if binary else raw}
+
+            # Safe default: echo with metadata, in the same frame type the client used.
+            body = json_dumps({
                 "type": "echo",
                 "user_id": user_id,
                 "payload": payload,
                 "ts": get_timestamp(),
             })
+            if binary:
+                await websocket.send_bytes(body)
+            else:
+                await websocket.send_text(body.decode("utf-8"))
     except WebSocketDisconnect:
         return
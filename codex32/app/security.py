@@ -3,11 +3,16 @@
 Note: This module intentionally avoids importing Pydantic models (e.g. `app.models`)
 so it can run on Python versions where Pydantic may not be compatible.
 """
+import hashlib
 import logging
+import secrets
+import string
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List, TypedDict
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple, TypedDict
 
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 
 from app.config import settings
@@ -19,6 +24,29 @@ logger = logging.getLogger(__name__)
 # Password hashing configuration
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Short-lived memo of bcrypt verification results for repeat service-to-service auth.
+# Keys are blake2b MACs of the (plain, hashed) pair under a per-process random key,
+# so neither plaintext nor a fast unsalted password hash is ever retained.
+_VERIFY_CACHE_MAXSIZE = 2048
+_VERIFY_CACHE_TTL_SEC = 60.0
+_VERIFY_CACHE_KEY = secrets.token_bytes(32)
+_verify_cache: Dict[bytes, Tuple[float, bool]] = {}
+
+
+@lru_cache(maxsize=1)
+def _jwt_settings() -> Tuple[str, str, timedelta, timedelta]:
+    """Resolve JWT signing settings once per process.
+
+    Returns (secret, algorithm, access TTL, refresh TTL). Call
+    ``_jwt_settings.cache_clear()`` after reloading settings.
+    """
+    return (
+        settings.API_SECRET_KEY.get_secret_value(),
+        settings.API_ALGORITHM,
+        timedelta(minutes=settings.API_ACCESS_TOKEN_EXPIRE_MINUTES),
+        timedelta(days=settings.API_REFRESH_TOKEN_EXPIRE_DAYS),
+    )
+
 
 class TokenUser(TypedDict, total=False):
     """Minimal user shape derived from JWTs.
@@ -59,7 +87,22 @@ class SecurityManager:
         Returns:
             True if password matches, False otherwise
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        key = hashlib.blake2b(
+            plain_password.encode() + b"\0" + hashed_password.encode(),
+            digest_size=16,
+            key=_VERIFY_CACHE_KEY,
+        ).digest()
+        now = time.monotonic()
+        cached = _verify_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        result = pwd_context.verify(plain_password, hashed_password)
+        if key not in _verify_cache and len(_verify_cache) >= _VERIFY_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts preserve insertion order).
+            _verify_cache.pop(next(iter(_verify_cache)), None)
+        _verify_cache[key] = (now + _VERIFY_CACHE_TTL_SEC, result)
+        return result
 
     @staticmethod
     def create_access_token(user_id: str, username: str, roles: List[str],
@@ -76,25 +119,21 @@ class SecurityManager:
         Returns:
             Encoded JWT token
         """
+        secret, algorithm, access_ttl, _ = _jwt_settings()
         if expires_delta is None:
-            expires_delta = timedelta(
-                minutes=settings.API_ACCESS_TOKEN_EXPIRE_MINUTES
-            )
+            expires_delta = access_ttl
 
+        now = utcnow()
         to_encode = {
             "sub": user_id,
             "username": username,
             "roles": roles,
-            "exp": utcnow() + expires_delta,
-            "iat": utcnow(),
+            "exp": now + expires_delta,
+            "iat": now,
             "type": "access",
         }
 
-        encoded_jwt = jwt.encode(
-            to_encode,
-            settings.API_SECRET_KEY.get_secret_value(),
-            algorithm=settings.API_ALGORITHM,
-        )
+        encoded_jwt = jwt.encode(to_encode, secret, algorithm=algorithm)
         return encoded_jwt
 
     @staticmethod
@@ -108,19 +147,16 @@ class SecurityManager:
         Returns:
             Encoded JWT token
         """
-        expires_delta = timedelta(days=settings.API_REFRESH_TOKEN_EXPIRE_DAYS)
+        secret, algorithm, _, expires_delta = _jwt_settings()
+        now = utcnow()
         to_encode = {
             "sub": user_id,
-            "exp": utcnow() + expires_delta,
-            "iat": utcnow(),
+            "exp": now + expires_delta,
+            "iat": now,
             "type": "refresh",
         }
 
-        encoded_jwt = jwt.encode(
-            to_encode,
-            settings.API_SECRET_KEY.get_secret_value(),
-            algorithm=settings.API_ALGORITHM,
-        )
+        encoded_jwt = jwt.encode(to_encode, secret, algorithm=algorithm)
         return encoded_jwt
 
     @staticmethod
@@ -137,14 +173,11 @@ class SecurityManager:
         Raises:
             AuthenticationError: If token is invalid or expired
         """
+        secret, algorithm, _, _ = _jwt_settings()
         try:
-            payload = jwt.decode(
-                token,
-                settings.API_SECRET_KEY.get_secret_value(),
-                algorithms=[settings.API_ALGORITHM],
-            )
+            payload = jwt.decode(token, secret, algorithms=[algorithm])
             return payload
-        except JWTError as e:
+        except jwt.InvalidTokenError as e:
             logger.warning(f"Invalid token: {e}")
             raise AuthenticationError(f"Invalid token: {str(e)}") from e
 
@@ -332,6 +365,8 @@ class InputValidator:
 
     MAX_STRING_LENGTH = 10000
     MAX_ARRAY_LENGTH = 1000
+    # Deletes every allowed bot ID character; anything left over is invalid.
+    _BOTID_TRANS = str.maketrans("", "", string.ascii_letters + string.digits + "-_")
     FORBIDDEN_PATTERNS = [
         "script>",
         "javascript:",
@@ -387,7 +422,7 @@ class InputValidator:
         if not bot_id or len(bot_id) > 64:
             raise ValueError("Invalid bot ID length")
 
-        if not all(c.isalnum() or c in "-_" for c in bot_id):
+        if bot_id.translate(cls._BOTID_TRANS):
             raise ValueError(
                 "Bot ID must contain only alphanumeric characters, hyphens, and underscores"
             )
@@ -13,16 +13,18 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
-from app.utils import atomic_save_json, load_json
+from app.utils import atomic_save_json, json_dumps, json_loads, load_json
 from app.utils import utcnow
 
 
-@dataclass
+@dataclass(slots=True)
 class PatchProposal:
     proposal_id: str
     title: str
@@ -39,56 +41,147 @@ class PatchProposal:
     reviewer: Optional[str] = None
 
 
+_Signature = Tuple[Optional[Tuple[int, int, int]], Optional[Tuple[int, int, int]]]
+
+
 class PatchStore:
-    def __init__(self, path: str = "codex32_patch_proposals.json"):
+    """Proposal store backed by a JSON snapshot plus an append-only event log.
+
+    The snapshot maps proposal ids to proposals: `{"proposals": {id: {...}}}`.
+
+    Each mutation appends one `{"op": "update", "proposal": ...}` line to the
+    event log; loading replays the log over the snapshot. Once the log grows
+    past `COMPACT_FACTOR` times the snapshot, the snapshot is rewritten and the
+    log truncated.
+
+    Proposals are held as plain dicts (the shape they're stored in) and only
+    wrapped in `PatchProposal` when handed out by `get`/`list`.
+    """
+
+    COMPACT_FACTOR = 4
+
+    def __init__(
+        self,
+        path: str = "codex32_patch_proposals.json",
+        events_path: Optional[str] = None,
+    ):
         self.path = Path(path)
+        # Derived from the snapshot name so stores sharing a directory keep separate logs.
+        self.events_path = (
+            Path(events_path) if events_path else self.path.with_suffix(".events.jsonl")
+        )
+        # Proposal dicts keyed by id, tagged with the file signatures they were built from.
+        self._cache: Optional[Tuple[_Signature, Dict[str, dict]]] = None
+        self._snapshot_size = 0
+        self._event_count = 0
+        # One store is shared by all API requests (threadpool handlers).
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        # Atomic saves replace the file, so the inode changes even within one mtime tick.
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _signature(self) -> _Signature:
+        return (self._stat(self.path), self._stat(self.events_path))
+
+    def _load_raw(self) -> Dict[str, dict]:
+        sig = self._signature()
+        if self._cache is not None and self._cache[0] == sig:
+            return self._cache[1]
+        data = load_json(str(self.path)) if sig[0] is not None else {}
+        proposals = data.get("proposals") or {}
+        if isinstance(proposals, list):
+            # Legacy snapshot layout; the next compaction rewrites it keyed by id.
+            proposals = {p["proposal_id"]: p for p in proposals}
+        index: Dict[str, dict] = proposals
+        self._snapshot_size = len(index)
+        self._event_count = 0
+        if sig[1] is not None:
+            with self.events_path.open("rb") as f:
+                for line in f:
+                    try:
+                        event = json_loads(line)
+                    except ValueError:
+                        continue  # torn trailing write
+                    if event.get("op") == "update":
+                        p = event["proposal"]
+                        index[p["proposal_id"]] = p
+                        self._event_count += 1
+        self._cache = (sig, index)
+        return index
 
-    def _load(self) -> Dict:
-        return load_json(str(self.path)) if self.path.exists() else {"proposals": []}
+    def _append_event(self, event: dict) -> None:
+        data = json_dumps(event) + b"\n"
+        self.events_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.events_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        self._event_count += 1
 
-    def _save(self, data: Dict) -> None:
-        atomic_save_json(str(self.path), data)
+    def _compact(self, index: Dict[str, dict]) -> None:
+        # Snapshot first: if we crash before truncating, replaying the log is idempotent.
+        atomic_save_json(str(self.path), {"proposals": index})
+        with self.events_path.open("wb"):
+            pass
+        self._snapshot_size = len(index)
+        self._event_count = 0
+
+    def list_raw(self) -> List[dict]:
+        """Stored proposal dicts, without building dataclasses. Treat as read-only."""
+        with self._lock:
+            return list(self._load_raw().values())
 
     def list(self) -> List[PatchProposal]:
-        data = self._load()
-        return [PatchProposal(**p) for p in data.get("proposals", [])]
+        return [PatchProposal(**d) for d in self.list_raw()]
 
     def get(self, proposal_id: str) -> Optional[PatchProposal]:
-        for p in self.list():
-            if p.proposal_id == proposal_id:
-                return p
-        return None
+        with self._lock:
+            d = self._load_raw().get(proposal_id)
+        return PatchProposal(**d) if d is not None else None
 
     def add(self, proposal: PatchProposal) -> PatchProposal:
-        data = self._load()
-        data.setdefault("proposals", []).append(asdict(proposal))
-        self._save(data)
+        record = asdict(proposal)
+        with self._lock:
+            index = self._load_raw()
+            try:
+                self._append_event({"op": "update", "proposal": record})
+                index[proposal.proposal_id] = record
+                if self._event_count > self.COMPACT_FACTOR * max(1, self._snapshot_size):
+                    self._compact(index)
+            except Exception:
+                self._cache = None
+                raise
+            self._cache = (self._signature(), index)
         return proposal
 
     def update(self, proposal: PatchProposal) -> PatchProposal:
-        data = self._load()
-        proposals = data.get("proposals", [])
-        for i, p in enumerate(proposals):
-            if p.get("proposal_id") == proposal.proposal_id:
-                proposals[i] = asdict(proposal)
-                data["proposals"] = proposals
-                self._save(data)
-                return proposal
-        # If not found, add
+        # Adds the proposal if it isn't stored yet.
         return self.add(proposal)
 
 
-def make_proposal_id(title: str, goal: str) -> str:
-    h = hashlib.sha256(f"{title}|{goal}|{utcnow().isoformat()}".encode()).hexdigest()[:12]
+def make_proposal_id(title: str, goal: str, now_iso: Optional[str] = None) -> str:
+    if now_iso is None:
+        now_iso = utcnow().isoformat()
+    # 6-byte BLAKE2b digest gives the same 12 hex chars as the old truncated SHA-256.
+    h = hashlib.blake2b(f"{title}|{goal}|{now_iso}".encode(), digest_size=6).hexdigest()
     return f"patch-{h}"
 
 
 def propose_patch(title: str, goal: str, diff: str, rationale: str, risks: List[str], tests: List[str]) -> PatchProposal:
+    now_iso = utcnow().isoformat()
     return PatchProposal(
-        proposal_id=make_proposal_id(title, goal),
+        proposal_id=make_proposal_id(title, goal, now_iso),
         title=title,
         goal=goal,
-    created_at=utcnow().isoformat(),
+        created_at=now_iso,
         status="proposed",
         diff=diff,
         rationale=rationale,
@@ -127,6 +220,10 @@ class PatchApplyError(RuntimeError):
     pass
 
 
+# Header that marks a diff as an applyable patch bundle.
+PATCH_SENTINEL = "*** Begin Patch"
+
+
 def apply_approved_proposal(store: PatchStore, proposal_id: str, reviewer: str) -> PatchProposal:
     """Apply an approved proposal.
 
@@ -147,7 +244,8 @@ def apply_approved_proposal(store: PatchStore, proposal_id: str, reviewer: str)
 
     # For safety, require a sentinel header in diff to indicate it was generated
     # by a trusted path that includes file targets.
-    if "*** Begin Patch" not in (p.diff or ""):
+    # It's a header, so only look at the head of the diff rather than scanning all of it.
+    if not (p.diff or "")[:64].lstrip().startswith(PATCH_SENTINEL):
         raise PatchApplyError(
             "Unsupported diff format. For safety, only unified patch bundles starting with '*** Begin Patch' are applyable."
         )
@@ -14,13 +14,12 @@ PAUSED, or explicitly disabled; and it enforces safety limits to avoid restart l
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from dataclasses import dataclass, asdict, field
+import os
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import deque
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
 
 import psutil
 
@@ -28,12 +27,19 @@ from app.adaptive_executor import AdaptiveExecutor
 from app.bot_registry import BotStatus, SecureRegistry
 from app.config import settings
 from app.container_engine import ContainerState
-from app.utils import utcnow
+from app.utils import json_dumps, json_loads, utcnow
 
 logger = logging.getLogger(__name__)
 
+# Linux exposes process state directly in /proc/<pid>/stat; elsewhere fall back to psutil.
+_HAS_PROCFS = os.path.exists("/proc/self/stat")
+# Process states (from /proc/<pid>/stat) that count as dead: zombie, dead.
+_DEAD_STATES = frozenset({"Z", "X"})
+# IncidentLog.tail reads the file backwards in chunks of this size.
+_TAIL_CHUNK_SIZE = 64 * 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class Incident:
     """A recorded supervisor incident for audit and debugging."""
 
@@ -47,19 +53,90 @@ class Incident:
 
 
 class IncidentLog:
-    """File-backed incident log (append-only)."""
+    """File-backed incident log (append-only).
+
+    Appends are written synchronously by default. While batching is active
+    (see `start_batching`), they are queued and a background task coalesces up
+    to `batch_size` records into one write + fsync.
+    """
 
-    def __init__(self, path: str = "codex32_incidents.jsonl"):
+    def __init__(
+        self,
+        path: str = "codex32_incidents.jsonl",
+        batch_size: int = 32,
+        batch_timeout_us: int = 100,
+    ):
         self.path = Path(path)
+        self.batch_size = max(1, batch_size)
+        self.batch_timeout_us = max(0, batch_timeout_us)
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
 
     def append(self, incident: Incident) -> None:
+        if self._queue is not None:
+            self._queue.put_nowait(incident)
+            return
+        self._write([incident], sync=False)
+
+    def append_batch(self, incidents: Iterable[Incident]) -> None:
+        """Append many incidents with a single write + fsync."""
+        if self._queue is not None:
+            for incident in incidents:
+                self._queue.put_nowait(incident)
+            return
+        incidents = list(incidents)
+        if incidents:
+            self._write(incidents, sync=True)
+
+    def _write(self, incidents: List[Incident], sync: bool) -> None:
+        # Dataclasses serialize natively; skip asdict()'s recursive deep copy.
+        data = b"".join(json_dumps(incident) + b"\n" for incident in incidents)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(asdict(incident), ensure_ascii=False) + "\n")
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+            if sync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def start_batching(self) -> None:
+        """Route appends through a queue drained by a background flusher task."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._flusher = asyncio.create_task(self._flush_loop(self._queue))
+
+    async def stop_batching(self) -> None:
+        """Flush queued incidents and return to synchronous appends."""
+        queue, flusher = self._queue, self._flusher
+        if queue is None or flusher is None:
+            return
+        self._queue = None
+        self._flusher = None
+        queue.put_nowait(None)  # sentinel: flush what's queued, then exit
+        await flusher
+
+    async def _flush_loop(self, queue: asyncio.Queue) -> None:
+        stopping = False
+        while not stopping:
+            batch = [await queue.get()]
+            if self.batch_timeout_us:
+                # Give a burst of appends (e.g. a supervisor storm) a moment to coalesce.
+                await asyncio.sleep(self.batch_timeout_us / 1_000_000)
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            incidents = [i for i in batch if i is not None]
+            stopping = len(incidents) != len(batch)
+            if not incidents:
+                continue
+            try:
+                await asyncio.to_thread(self._write, incidents, True)
+            except Exception as e:
+                logger.warning(f"Failed to write incident log batch: {e}")
 
     def tail(self, limit: int = 200) -> List[dict]:
-        if not self.path.exists():
-            return []
         # Avoid reading the entire file: keep only the last N lines.
         try:
             limit_n = max(0, int(limit))
@@ -69,16 +146,41 @@ class IncidentLog:
         if limit_n <= 0:
             return []
 
-        with self.path.open("r", encoding="utf-8") as f:
-            lines = list(deque(f, maxlen=limit_n))
+        try:
+            with self.path.open("rb") as f:
+                lines = self._read_last_lines(f, limit_n)
+        except FileNotFoundError:
+            return []
         out: List[dict] = []
         for line in lines:
             try:
-                out.append(json.loads(line))
+                out.append(json_loads(line))
             except Exception:
                 continue
         return out
 
+    @staticmethod
+    def _read_last_lines(f, limit: int) -> List[bytes]:
+        # tail -n: read backwards from EOF in chunks until `limit` full lines are
+        # buffered, so cost scales with the lines returned rather than the file size.
+        pos = f.seek(0, os.SEEK_END)
+        chunks: List[bytes] = []
+        newlines = 0
+        # Count newlines per chunk as it arrives; re-scanning (and re-copying) the
+        # growing buffer each step would make long lines quadratic.
+        while pos > 0 and newlines <= limit:
+            step = min(_TAIL_CHUNK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+        chunks.reverse()
+        lines = b"".join(chunks).splitlines()
+        if pos > 0:
+            lines = lines[1:]  # first line may be partial
+        return lines[-limit:]
+
 
 @dataclass
 class RestartState:
@@ -107,11 +209,15 @@ class BotSupervisor:
         self._task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
         self._restart_state: Dict[str, RestartState] = {}
+        self._run_states = frozenset({BotStatus.RUNNING.value, BotStatus.DEPLOYING.value})
+        # Bounds concurrent health checks per tick (container engine pressure).
+        self._health_sem = asyncio.Semaphore(32)
 
     def start(self) -> None:
         if self._task and not self._task.done():
             return
         self._stop_event.clear()
+        self.incidents.start_batching()
         self._task = asyncio.create_task(self._run_loop())
         logger.info("BotSupervisor started")
 
@@ -122,6 +228,7 @@ class BotSupervisor:
                 await asyncio.wait_for(self._task, timeout=5)
             except asyncio.TimeoutError:
                 self._task.cancel()
+        await self.incidents.stop_batching()
         logger.info("BotSupervisor stopped")
 
     def _get_restart_state(self, bot_id: str) -> RestartState:
@@ -137,37 +244,90 @@ class BotSupervisor:
                 await self.tick()
             except Exception as e:
                 logger.exception(f"Supervisor tick failed: {e}")
-            await asyncio.sleep(self.interval_sec)
+            # Sleep until the next tick, but wake immediately when stop() is called.
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.interval_sec)
+            except asyncio.TimeoutError:
+                pass
 
     async def tick(self) -> None:
-        bots = self.registry.get_all_bots()
+        # Plain dict copies straight from the registry; no BotRecord wrap-then-copy.
+        bots = self.registry.get_all_bots_as_dicts()
+        # One clock read per tick; every status write and incident below reuses it.
         now = utcnow()
-
-        for bot_rec in bots:
-            # The registry returns BotRecord wrappers (attribute + mapping-ish).
-            # Normalize immediately so the rest of the supervisor deals in dicts.
-            bot = dict(bot_rec)
-            # Only supervise bots that are expected to be running
-            status_val = None
-            try:
-                status_val = bot.get("status")  # type: ignore[call-arg]
-            except Exception:
-                status_val = getattr(bot, "status", None)
-
-            # Support
-            # - dict status strings ("running")
-            # - our BotStatus enum
-            # - legacy app.models.BotStatus enum (its str() looks like "BotStatus.RUNNING")
-            if hasattr(status_val, "value"):
-                status_val = getattr(status_val, "value")
-
-            if str(status_val) not in {BotStatus.RUNNING.value, BotStatus.DEPLOYING.value}:
+        now_iso = now.isoformat()
+
+        supervised: List[dict] = []
+        for bot in bots:
+            # Only supervise bots that are expected to be running.
+            # Status may be a plain string ("running"), our BotStatus enum, or the
+            # legacy app.models.BotStatus enum; both enums carry the string in .value.
+            status_val = bot.get("status")
+            if getattr(status_val, "value", status_val) not in self._run_states:
                 continue
-
-            if not await self._is_bot_healthy(bot):
-                await self._handle_unhealthy(bot, now)
-
-    async def _is_bot_healthy(self, bot: dict) -> bool:
+            supervised.append(bot)
+
+        # Health checks are read-only, so run them concurrently; healing mutates the
+        # registry and executor state, so that phase stays sequential.
+        # Local-process bots are probed in one batch off the event loop.
+        containers = self.executor.running_containers
+        pids = [
+            bot["process_id"]
+            for bot in supervised
+            if bot.get("process_id") and str(bot.get("id")) not in containers
+        ]
+        pid_states = await self._probe_pids(pids) if pids else {}
+
+        results = await asyncio.gather(*(self._check_health(bot, pid_states) for bot in supervised))
+        dirty: List[dict] = []
+        try:
+            for bot, healthy in zip(supervised, results):
+                if not healthy:
+                    await self._handle_unhealthy(bot, now, now_iso, dirty)
+        finally:
+            # Registry-only changes (quarantines) are persisted in one write per tick.
+            # Bots can be deleted through the API while the loop awaits other bots'
+            # stop/run calls; update_bots rejects the whole batch on an unknown id.
+            live: List[dict] = []
+            for bot in dirty:
+                if self.registry.get_bot_by_id(str(bot.get("id"))) is None:
+                    logger.warning(f"Skipping quarantine of deleted bot {bot.get('id')}")
+                else:
+                    live.append(bot)
+            if live:
+                self.registry.update_bots(live)
+
+    async def _check_health(self, bot: dict, pid_states: Dict[int, Optional[str]]) -> bool:
+        async with self._health_sem:
+            return await self._is_bot_healthy(bot, pid_states)
+
+    async def _probe_pids(self, pids: List[int]) -> Dict[int, Optional[str]]:
+        return await asyncio.to_thread(self._probe_pids_sync, pids)
+
+    @staticmethod
+    def _probe_pids_sync(pids: List[int]) -> Dict[int, Optional[str]]:
+        """Map each pid to its state char (R/S/D/Z/T/...), or None if it doesn't exist."""
+        states: Dict[int, Optional[str]] = {}
+        for pid in pids:
+            if _HAS_PROCFS:
+                try:
+                    with open(f"/proc/{pid}/stat", "rb") as f:
+                        stat = f.read()
+                    # Field 2 (comm) is parenthesised and may contain spaces; state follows it.
+                    states[pid] = chr(stat[stat.rindex(b")") + 2])
+                except (OSError, ValueError, IndexError):
+                    states[pid] = None
+                continue
+            try:
+                proc = psutil.Process(pid)
+                states[pid] = "Z" if proc.status() == psutil.STATUS_ZOMBIE else "R"
+            except psutil.Error:
+                states[pid] = None
+        return states
+
+    async def _is_bot_healthy(
+        self, bot: dict, pid_states: Optional[Dict[int, Optional[str]]] = None
+    ) -> bool:
         # Container-managed: check via executor tracking
         bot_id = str(bot.get("id"))
         if bot_id in self.executor.running_containers:
@@ -181,21 +341,18 @@ class BotSupervisor:
             except Exception:
                 return False
 
-        # Local process: check psutil process status
+        # Local process: check the process state
         pid = bot.get("process_id")
         if not pid:
             return False
-        try:
-            proc = psutil.Process(pid)
-            if not proc.is_running():
-                return False
-            if proc.status() == psutil.STATUS_ZOMBIE:
-                return False
-        except psutil.Error:
-            return False
-        return True
-
-    async def _handle_unhealthy(self, bot: dict, now: datetime) -> None:
+        if pid_states is None or pid not in pid_states:
+            pid_states = await self._probe_pids([pid])
+        state = pid_states.get(pid)
+        return state is not None and state not in _DEAD_STATES
+
+    async def _handle_unhealthy(
+        self, bot: dict, now: datetime, now_iso: str, dirty: Optional[List[dict]] = None
+    ) -> None:
         bot_id = str(bot.get("id"))
         st = self._get_restart_state(bot_id)
         if st.next_allowed_at and now < st.next_allowed_at:
@@ -207,14 +364,31 @@ class BotSupervisor:
         if st.failures > self.max_failures:
             bot["status"] = BotStatus.ERROR.value
             bot["last_error"] = f"Supervisor quarantined bot after {st.failures} failed heal attempts"
-            bot["updated_at"] = utcnow().isoformat()
-            self.registry.update_bot(bot)
+            bot["updated_at"] = now_iso
+            if dirty is not None:
+                dirty.append(bot)
+            else:
+                self.registry.update_bot(bot)
 
-            self._record(bot, "quarantined", str(bot.get("last_error")), {"failures": st.failures})
+            self._record(
+                bot,
+                "quarantined",
+                str(bot.get("last_error")),
+                {"failures": st.failures},
+                now,
+                now_iso,
+            )
             return
 
         # Attempt recovery
-        self._record(bot, "unhealthy", "Bot unhealthy; attempting self-heal", {"failures": st.failures})
+        self._record(
+            bot,
+            "unhealthy",
+            "Bot unhealthy; attempting self-heal",
+            {"failures": st.failures},
+            now,
+            now_iso,
+        )
 
         # Strategy:
         # 1) Try stop (best-effort)
@@ -233,6 +407,8 @@ class BotSupervisor:
                     "restart",
                     "Restarted bot successfully",
                     {"mode": (bot.get("deployment_config") or {}).get("deployment_type")},
+                    now,
+                    now_iso,
                 )
                 return
         except Exception as e:
@@ -241,6 +417,8 @@ class BotSupervisor:
                 "restart_failed",
                 f"Restart failed: {e}",
                 {"mode": (bot.get("deployment_config") or {}).get("deployment_type")},
+                now,
+                now_iso,
             )
 
         # 3) Fallback: if container mode, switch to local_process and try again
@@ -250,26 +428,50 @@ class BotSupervisor:
                 dc = dict(bot.get("deployment_config") or {})
                 dc["deployment_type"] = "local_process"
                 bot["deployment_config"] = dc
-                bot["updated_at"] = utcnow().isoformat()
+                bot["updated_at"] = now_iso
+                # Written immediately: run_bot persists its own copy of the bot, so
+                # deferring this to the end of the tick would clobber its updates.
                 self.registry.update_bot(bot)
 
                 ok = await self.executor.run_bot(bot)
                 if ok:
                     st.next_allowed_at = now + timedelta(seconds=min(60, 2 ** st.failures))
-                    self._record(bot, "fallback", "Fell back to local process and restarted successfully", {})
+                    self._record(
+                        bot,
+                        "fallback",
+                        "Fell back to local process and restarted successfully",
+                        {},
+                        now,
+                        now_iso,
+                    )
                     return
             except Exception as e:
-                self._record(bot, "fallback_failed", f"Fallback restart failed: {e}", {})
+                self._record(
+                    bot, "fallback_failed", f"Fallback restart failed: {e}", {}, now, now_iso
+                )
 
         st.next_allowed_at = now + timedelta(seconds=min(60, 2 ** st.failures))
 
-    def _record(self, bot: dict, kind: str, message: str, data: Optional[Dict] = None) -> None:
+    def _record(
+        self,
+        bot: dict,
+        kind: str,
+        message: str,
+        data: Optional[Dict] = None,
+        now: Optional[datetime] = None,
+        now_iso: Optional[str] = None,
+    ) -> None:
+        if now is None:
+            now = utcnow()
+        if now_iso is None:
+            now_iso = now.isoformat()
         incident = Incident(
-            incident_id=f"inc-{bot.get('id')}-{int(utcnow().timestamp())}",
+            incident_id=f"inc-{bot.get('id')}-{int(now.timestamp())}",
             bot_id=str(bot.get("id")),
             bot_name=str(bot.get("name")),
             kind=kind,
             message=message,
+            created_at=now_iso,
             data=data or {},
         )
         try:
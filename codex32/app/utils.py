@@ -4,14 +4,84 @@ import json
 import logging
 import tempfile
 import hashlib
+import mmap
 import ast
-from typing import Any, Dict, Optional
-from pathlib import Path
+from functools import lru_cache
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Optional, Union
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json fallback
+    orjson = None
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional, only needed for algorithm="blake3"
+    blake3 = None
+
+# calculate_file_hash: read size per syscall, and the size above which the file is
+# mmapped and hashed in a single update() call.
+_HASH_CHUNK_SIZE = 1 << 20
+_HASH_MMAP_THRESHOLD = 16 << 20
+
+# validate_bot_script: number of (path, mtime, size) syntax checks remembered.
+_SCRIPT_CHECK_CACHE_SIZE = 256
+
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Match orjson's native dataclass/datetime support on the stdlib fallback."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Built once and reused: json.dumps() with non-default arguments constructs a new
+# JSONEncoder on every call, and the orjson option mask never changes.
+_COMPACT_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=_json_default
+)
+_PRETTY_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2, default=_json_default)
+# OPT_NON_STR_KEYS: the stdlib encoder stringifies int/float/bool/None keys, and
+# orjson raises on them without it.
+_ORJSON_COMPACT_OPTS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+_ORJSON_PRETTY_OPTS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    if orjson is not None
+    else 0
+)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_COMPACT_OPTS)
+    return _COMPACT_ENCODER.encode(data).encode("utf-8")
+
+
+def _json_dumps_pretty(data: Any) -> bytes:
+    """Serialize to indented, newline-terminated UTF-8 JSON bytes for on-disk files."""
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_PRETTY_OPTS)
+    return (_PRETTY_ENCODER.encode(data) + "\n").encode("utf-8")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str (orjson when installed).
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def atomic_save_json(filename: str, data: Dict[str, Any]) -> None:
     """
     Saves JSON data atomically to prevent corruption.
@@ -34,14 +104,13 @@ def atomic_save_json(filename: str, data: Dict[str, Any]) -> None:
 
         # Create temporary file in the same directory for atomic rename
         with tempfile.NamedTemporaryFile(
-            dir=path, mode="w", delete=False, encoding="utf-8", suffix=".tmp"
+            dir=path, mode="wb", delete=False, suffix=".tmp"
         ) as tmp_file:
-            json.dump(data, tmp_file, indent=4)
             tmp_path = tmp_file.name
-
-        # Sync data to disk
-        with open(tmp_path, "rb") as f:
-            os.fsync(f.fileno())
+            tmp_file.write(_json_dumps_pretty(data))
+            # Sync data to disk before the rename makes it visible
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
 
         # Atomically replace the target file
         os.replace(tmp_path, filename)
@@ -68,13 +137,12 @@ def load_json(filename: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing parsed JSON, or empty dict if file doesn't exist
     """
-    if not os.path.exists(filename):
+    try:
+        with open(filename, "rb") as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
         logger.warning(f"JSON file not found: {filename}, returning empty dict")
         return {}
-
-    try:
-        with open(filename, "r", encoding="utf-8") as f:
-            return json.load(f)
     except json.JSONDecodeError as e:
         logger.error(f"Failed to decode JSON from {filename}: {e}")
         return {}
@@ -98,12 +166,21 @@ def validate_bot_script(script_path: str) -> bool:
         ValueError: If file is not a .py file
         SyntaxError: If Python syntax is invalid
     """
-    if not os.path.exists(script_path):
+    try:
+        st = os.stat(script_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Script not found: {script_path}")
 
     if not script_path.endswith(".py"):
         raise ValueError("Invalid file type: Must be a .py file")
 
+    # Restart loops re-validate the same file; only re-parse when it has changed.
+    return _check_script_syntax(script_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=_SCRIPT_CHECK_CACHE_SIZE)
+def _check_script_syntax(script_path: str, mtime_ns: int, size: int) -> bool:
+    """Parse a script once per (path, mtime, size); failures are not cached."""
     try:
         with open(script_path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -131,16 +208,14 @@ def validate_file_path(base_dir: str, user_path: str) -> str:
     Raises:
         ValueError: If path attempts to escape base directory
     """
-    base = Path(base_dir).resolve()
-    target = (base / user_path).resolve()
+    base = os.path.realpath(base_dir)
+    target = os.path.realpath(os.path.join(base, user_path))
 
     # Ensure target is within base directory
-    try:
-        target.relative_to(base)
-    except ValueError:
+    if os.path.commonpath([base, target]) != base:
         raise ValueError(f"Path traversal detected: {user_path}")
 
-    return str(target)
+    return target
 
 
 def calculate_file_hash(filepath: str, algorithm: str = "sha256") -> str:
@@ -149,21 +224,33 @@ def calculate_file_hash(filepath: str, algorithm: str = "sha256") -> str:
 
     Args:
         filepath: Path to the file
-        algorithm: Hash algorithm (default: sha256)
+        algorithm: Hash algorithm (default: sha256). "blake3" requires the
+            optional `blake3` package.
 
     Returns:
         Hex digest of the file hash
 
     Raises:
         FileNotFoundError: If file doesn't exist
+        ValueError: If the algorithm is unsupported
     """
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    hasher = hashlib.new(algorithm)
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ValueError("blake3 hashing requires the 'blake3' package")
+        hasher = blake3.blake3()
+    else:
+        hasher = hashlib.new(algorithm)
+
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
+        if os.fstat(f.fileno()).st_size >= _HASH_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
 
     return hasher.hexdigest()
 
@@ -241,11 +328,17 @@ def cleanup_file(filepath: str) -> bool:
 
 
 class AtomicFileWriter:
-    """Context manager for atomic file writing operations."""
+    """Context manager for atomic file writing operations.
 
-    def __init__(self, filepath: str):
+    With `binary=True` the temporary file is opened in "wb" mode so callers can
+    write pre-encoded bytes (e.g. `json_dumps` output) without a decode/encode
+    roundtrip.
+    """
+
+    def __init__(self, filepath: str, binary: bool = False):
         """Initialize atomic writer for a target file."""
         self.filepath = filepath
+        self.binary = binary
         self.tmp_file = None
         self.tmp_path = None
 
@@ -254,21 +347,25 @@ class AtomicFileWriter:
         path = os.path.dirname(self.filepath) or "."
         os.makedirs(path, exist_ok=True)
 
-        self.tmp_file = tempfile.NamedTemporaryFile(
-            dir=path, mode="w", delete=False, encoding="utf-8", suffix=".tmp"
-        )
+        if self.binary:
+            self.tmp_file = tempfile.NamedTemporaryFile(
+                dir=path, mode="wb", delete=False, suffix=".tmp"
+            )
+        else:
+            self.tmp_file = tempfile.NamedTemporaryFile(
+                dir=path, mode="w", delete=False, encoding="utf-8", suffix=".tmp"
+            )
         self.tmp_path = self.tmp_file.name
         return self.tmp_file
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Atomically replace target file or clean up on error."""
-        self.tmp_file.close()
-
         if exc_type is None:
-            # Success: atomically replace target
+            # Success: sync the still-open file, then atomically replace target
             try:
-                with open(self.tmp_path, "rb") as f:
-                    os.fsync(f.fileno())
+                self.tmp_file.flush()
+                os.fsync(self.tmp_file.fileno())
+                self.tmp_file.close()
                 os.replace(self.tmp_path, self.filepath)
                 logger.debug(f"Atomic write completed: {self.filepath}")
             except Exception as e:
@@ -277,6 +374,7 @@ class AtomicFileWriter:
                 raise
         else:
             # Error: clean up temporary file
+            self.tmp_file.close()
             cleanup_file(self.tmp_path)
             logger.warning(f"Atomic write cancelled due to exception: {exc_type}")
 
@@ -11,45 +11,94 @@ This module contains:
 """
 
 # CRITICAL: Apply pydantic compatibility patches BEFORE ANY fastapi imports
+# (the module patches on import, once per process).
 import app.pydantic_patch  # noqa: F401
-# Ensure the patch is applied
-from pydantic.fields import ModelField
-if not hasattr(ModelField._set_default_and_type, "__patched_for_py314__"):
-    from app.pydantic_patch import apply_patch
-    apply_patch()
-
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
+
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 
 from app.config import settings
 from app.logging_config import setup_logging, get_logger
 from app.container_engine import init_engine, shutdown_engine
 from app.routers import auth_router, bots_router, system_router, ws_router, self_router, guide_router, dashboard_router
+from app import inspect_cache
+from app.utils import json_dumps, orjson
 from app.dependencies import get_registry, get_executor
 from app.supervisor import init_supervisor, shutdown_supervisor
 
-# Try to import intelligent_bots router, but don't fail if there are compatibility issues
-intelligent_bots_router = None
-try:
-    from app.routers.intelligent_bots import router as intelligent_bots_router
-    print("✅ Successfully imported intelligent_bots_router")
-except Exception as e:
-    # Log the error but continue - the intelligent_bots features won't be available
-    import traceback
-    print(f"❌ Could not load intelligent_bots router: {e}")
-    traceback.print_exc()
+# Memoize FastAPI's per-request callable introspection (must precede route building).
+inspect_cache.apply_patch()
 
 # Initialize logging
 setup_logging()
 logger = get_logger(__name__)
 
 
+def _load_intelligent_bots_router():
+    """Import the intelligent_bots router, or None if it fails (compatibility issues)."""
+    try:
+        from app.routers.intelligent_bots import router
+    except Exception as e:
+        # Continue without it - the intelligent_bots features won't be available.
+        if settings.DEBUG:
+            logger.exception(f"Could not load intelligent_bots router: {e}")
+        else:
+            logger.warning(f"Could not load intelligent_bots router: {e}")
+        return None
+    logger.debug("Loaded intelligent_bots router")
+    return router
+
+
+intelligent_bots_router = _load_intelligent_bots_router()
+
+
+@asynccontextmanager
+async def engine_lifespan(app: FastAPI):
+    """Container engine for the lifetime of the app."""
+    await init_engine(storage_dir=settings.CONTAINER_STORAGE_DIR)
+    logger.info(f"Container engine initialized at {settings.CONTAINER_STORAGE_DIR}")
+    try:
+        yield
+    finally:
+        await shutdown_engine()
+        logger.info("Container engine shut down")
+
+
+@asynccontextmanager
+async def supervisor_lifespan(app: FastAPI):
+    """Self-healing supervisor (free, local-first); optional if it fails to start."""
+    try:
+        registry = get_registry()
+        executor = get_executor()
+        init_supervisor(registry=registry, executor=executor)
+        logger.info("Self-healing supervisor started")
+    except Exception as e:
+        # If supervisor can't start, system still runs. We log loudly but remain available.
+        logger.exception(f"Failed to start supervisor (continuing without it): {e}")
+    try:
+        yield
+    finally:
+        try:
+            await shutdown_supervisor()
+        except Exception as e:
+            logger.warning(f"Supervisor shutdown error: {e}")
+
+
+@lru_cache(maxsize=1)
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
 
+    Built once per process: router wiring and route compilation are not repeated
+    by later callers (e.g. test modules), which share the instance and adjust it
+    through `app.dependency_overrides`. Use `create_app.__wrapped__()` for a
+    fresh, independent app.
+
     Returns:
         Configured FastAPI application instance
     """
@@ -58,39 +107,32 @@ def create_app() -> FastAPI:
         """Manage application startup/shutdown.
 
         FastAPI's `on_event` is deprecated; lifespan is the modern replacement.
+        Component lifespans are composed on an exit stack, which unwinds them in
+        reverse: the supervisor stops before the engine it drives shuts down.
         """
         logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
         logger.info(f"Debug mode: {settings.DEBUG}")
         logger.info(f"Log level: {settings.LOG_LEVEL}")
         logger.info("Using custom container engine (no Docker dependency)")
 
-        # Initialize container engine
-        await init_engine(storage_dir=settings.CONTAINER_STORAGE_DIR)
-        logger.info(f"Container engine initialized at {settings.CONTAINER_STORAGE_DIR}")
+        # uvicorn's "auto" loop picks uvloop when it's installed; flag deployments
+        # that fell back to the stdlib loop.
+        loop_module = type(asyncio.get_running_loop()).__module__
+        if not loop_module.startswith("uvloop"):
+            logger.warning(
+                f"Running on the default asyncio event loop ({loop_module}); install uvloop"
+            )
 
-        # Start self-healing supervisor (free, local-first)
-        try:
-            registry = get_registry()
-            executor = get_executor()
-            init_supervisor(registry=registry, executor=executor)
-            logger.info("Self-healing supervisor started")
-        except Exception as e:
-            # If supervisor can't start, system still runs. We log loudly but remain available.
-            logger.exception(f"Failed to start supervisor (continuing without it): {e}")
+        primed = inspect_cache.prime_routes(app.routes)
+        logger.debug(f"Primed introspection cache for {primed} routes")
 
-        try:
-            yield
-        finally:
-            logger.info(f"Shutting down {settings.APP_NAME}")
-            # Stop supervisor first so it doesn't race against shutdown operations.
+        async with AsyncExitStack() as stack:
+            await stack.enter_async_context(engine_lifespan(app))
+            await stack.enter_async_context(supervisor_lifespan(app))
             try:
-                await shutdown_supervisor()
-            except Exception as e:
-                logger.warning(f"Supervisor shutdown error: {e}")
-
-            # Shutdown container engine
-            await shutdown_engine()
-            logger.info("Container engine shut down")
+                yield
+            finally:
+                logger.info(f"Shutting down {settings.APP_NAME}")
 
     # Initialize FastAPI
     app = FastAPI(
@@ -101,6 +143,8 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        # Render dict/list responses with orjson when it's installed.
+        default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
     )
 
     # CORS Middleware
@@ -124,33 +168,38 @@ def create_app() -> FastAPI:
     app.include_router(guide_router)
     app.include_router(dashboard_router)
 
+    # Health check and root payloads depend only on settings: encode them once here
+    # instead of building and serializing a dict on every probe.
+    health_body = json_dumps({
+        "status": "healthy",
+        "service": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "container_engine": "custom",
+    })
+    root_body = json_dumps({
+        "message": f"Welcome to {settings.APP_NAME}",
+        "version": settings.APP_VERSION,
+        "docs": "/docs",
+        "redoc": "/redoc",
+        "dashboard": "/api/v1/dashboard",
+        "features": {
+            "container_engine": "custom (no Docker)",
+            "deployment_types": ["local_process", "custom_container", "kubernetes_pod"],
+            "isolation_levels": ["minimal", "standard", "strict"]
+        }
+    })
+
     # Health check endpoint
     @app.get("/health")
     async def health_check():
         """Simple health check endpoint."""
-        return {
-            "status": "healthy",
-            "service": settings.APP_NAME,
-            "version": settings.APP_VERSION,
-            "container_engine": "custom",
-        }
+        return Response(content=health_body, media_type="application/json")
 
     # Root endpoint
     @app.get("/")
     async def root():
         """API root endpoint."""
-        return {
-            "message": f"Welcome to {settings.APP_NAME}",
-            "version": settings.APP_VERSION,
-            "docs": "/docs",
-            "redoc": "/redoc",
-            "dashboard": "/api/v1/dashboard",
-            "features": {
-                "container_engine": "custom (no Docker)",
-                "deployment_types": ["local_process", "custom_container", "kubernetes_pod"],
-                "isolation_levels": ["minimal", "standard", "strict"]
-            }
-        }
+        return Response(content=root_body, media_type="application/json")
 
     return app
 
@@ -160,12 +209,24 @@ app = create_app()
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
 
+    # reload is incompatible with multiple workers, so DEBUG always runs one.
+    if settings.DEBUG:
+        workers = 1
+    else:
+        workers = settings.API_WORKERS or (os.cpu_count() or 1) * 2 + 1
+
     uvicorn.run(
-        app,
+        # Import string: required for reload and for spawning worker processes.
+        "main:app",
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.DEBUG,
+        workers=workers,
         log_level=settings.LOG_LEVEL.lower(),
+        # loop/http/ws stay "auto": uvicorn uses uvloop, httptools and websockets
+        # when uvicorn[standard] installed them (uvloop isn't available on Windows)
+        # and falls back to the pure-Python implementations otherwise.
     )
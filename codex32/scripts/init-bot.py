@@ -9,6 +9,7 @@ Usage:
 
 import sys
 import os
+import re
 import argparse
 import shutil
 from pathlib import Path
@@ -23,6 +24,14 @@ TEMPLATES = {
     "orchestrator": "Orchestrator for coordinating other bots"
 }
 
+# Placeholder bot names used in template configs ("worker_bot", "api_bot", ...).
+TEMPLATE_NAME_PATTERN = re.compile(r"(?:worker|collector|api|ml|orchestrator)_bot")
+
+# Generated files that are never copied from a template into a new bot.
+TEMPLATE_COPY_IGNORE = shutil.ignore_patterns(
+    "__pycache__", "*.pyc", "*.pyo", ".pytest_cache", ".git"
+)
+
 
 def validate_bot_name(name: str) -> bool:
     """Validate bot name."""
@@ -93,7 +102,14 @@ def init_bot_from_template(template: str, name: str, force: bool = False) -> boo
     # Copy template
     try:
         print(f"📦 Creating bot from template: {template}")
-        shutil.copytree(template_path, bot_path)
+        # Plain copy: the new bot doesn't need the template's timestamps/metadata,
+        # nor any bytecode or tool caches left behind in the template directory.
+        shutil.copytree(
+            template_path,
+            bot_path,
+            ignore=TEMPLATE_COPY_IGNORE,
+            copy_function=shutil.copy,
+        )
 
         # Create additional directories
         tests_dir = bot_path / "tests"
@@ -102,18 +118,13 @@ def init_bot_from_template(template: str, name: str, force: bool = False) -> boo
         # Update config with bot name
         config_file = bot_path / "config.yaml"
         if config_file.exists():
-            with open(config_file, "r") as f:
-                config = f.read()
-
-            # Replace template name with actual name
-            config = config.replace("worker_bot", name)
-            config = config.replace("collector_bot", name)
-            config = config.replace("api_bot", name)
-            config = config.replace("ml_bot", name)
-            config = config.replace("orchestrator_bot", name)
-
-            with open(config_file, "w") as f:
-                f.write(config)
+            # Replace template name with actual name (single pass), then swap the
+            # rewritten file in atomically so a crash never leaves it half-written.
+            template = config_file.read_text(encoding="utf-8")
+            config = TEMPLATE_NAME_PATTERN.sub(lambda _: name, template)
+            tmp_file = config_file.with_suffix(".yaml.tmp")
+            tmp_file.write_text(config, encoding="utf-8")
+            os.replace(tmp_file, config_file)
 
         # Create __init__.py for tests
         init_file = tests_dir / "__init__.py"
@@ -14,10 +14,16 @@ Template Features:
 import asyncio
 import logging
 import sys
+import time
 from typing import Dict, Any
 from datetime import datetime
 import json
 
+try:
+    import uvloop
+except ImportError:  # optional: falls back to the stdlib event loop
+    uvloop = None
+
 
 # Configure logging
 logging.basicConfig(
@@ -52,6 +58,10 @@ class WorkerBot:
         self.processed_count = 0
         self.error_count = 0
         self.start_time = None
+        self._start_monotonic = None
+        # get_status() may be polled often; reuse its ISO timestamp within a second.
+        self._ts_cache_epoch = -1
+        self._ts_cache = ""
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -61,8 +71,13 @@ class WorkerBot:
             Dict with status details
         """
         uptime = 0
-        if self.start_time:
-            uptime = (datetime.now() - self.start_time).total_seconds()
+        if self._start_monotonic is not None:
+            uptime = time.monotonic() - self._start_monotonic
+
+        epoch = int(time.time())
+        if epoch != self._ts_cache_epoch:
+            self._ts_cache_epoch = epoch
+            self._ts_cache = datetime.now().isoformat()
 
         return {
             "name": self.name,
@@ -72,7 +87,7 @@ class WorkerBot:
             "processed_count": self.processed_count,
             "error_count": self.error_count,
             "uptime_seconds": uptime,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._ts_cache
         }
 
     async def get_next_task(self) -> Dict[str, Any] | None:
@@ -170,6 +185,7 @@ class WorkerBot:
         """
         self.running = True
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         logger.info(f"{self.name} v{self.version} started")
 
         try:
@@ -275,6 +291,9 @@ async def main():
 
 if __name__ == "__main__":
     try:
+        if uvloop is not None:
+            # libuv-backed loop: cheaper scheduling for the polling/processing coroutines
+            uvloop.install()
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\nStopped by user")
@@ -1,9 +1,17 @@
 """Pytest configuration and shared fixtures."""
+import asyncio
 import sys
 import os
 from pathlib import Path
 
+import httpx
 import pytest
+from fastapi.testclient import TestClient
+
+try:
+    import uvloop  # installed with uvicorn[standard]
+except ImportError:  # pragma: no cover - fall back to asyncio's default loop
+    uvloop = None
 
 # Add app directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -15,16 +23,111 @@ from app.config import Settings
 from app.bot_registry import SecureRegistry
 from app.adaptive_executor import AdaptiveExecutor
 from app.security import SecurityManager, RBACSystem
+from app.dependencies import get_executor, get_registry
+from main import create_app
+from tests.fakes import InMemoryRegistry
+
+
+@pytest.fixture
+def event_loop():
+    """Run async tests on uvloop when it is installed (overrides pytest-asyncio's loop)."""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def memory_registry():
+    """Provide the session's in-memory registry (emptied after every test)."""
+    return InMemoryRegistry()
+
+
+@pytest.fixture(scope="session")
+def executor(memory_registry):
+    """Provide one executor for the session, bound to `memory_registry`."""
+    return AdaptiveExecutor(registry=memory_registry)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_bot_state(memory_registry, executor):
+    """Keep tests isolated while they share the session registry and executor."""
+    yield
+    memory_registry.reset()
+    executor.running_processes.clear()
+    executor.running_psutil.clear()
+    executor.process_creation_time.clear()
+    executor.running_containers.clear()
+
+
+@pytest.fixture(scope="session", name="app")
+def fastapi_app(memory_registry, executor):
+    """Provide one application for the whole session.
+
+    Its registry and executor dependencies are pointed at the shared in-memory
+    instances once, here; tests needing other overrides must restore them.
+    """
+    app = create_app()
+    app.dependency_overrides[get_registry] = lambda: memory_registry
+    app.dependency_overrides[get_executor] = lambda: executor
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Provide a session-wide TestClient.
+
+    The lifespan (container engine + supervisor) is not started; most endpoints
+    don't need it. Use `client_with_lifespan` for tests that do.
+    """
+    return TestClient(app)
+
+
+@pytest.fixture
+def client_with_lifespan(app, memory_registry, executor, tmp_path, monkeypatch):
+    """Provide a TestClient with the app's startup/shutdown run around the test.
+
+    The supervisor is wired to the shared in-memory registry/executor. The test
+    runs from tmp_path, so files the app creates at relative default paths (the
+    supervisor's incident log, the patch store) land there rather than in the
+    working tree; the container engine also stores its state under tmp_path.
+    """
+    import main
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "get_registry", lambda: memory_registry)
+    monkeypatch.setattr(main, "get_executor", lambda: executor)
+    monkeypatch.setattr(main.settings, "CONTAINER_STORAGE_DIR", str(tmp_path / "containers"))
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def dashboard_data(client):
+    """Fetch and parse /api/v1/dashboard/data once for every schema check."""
+    resp = client.get("/api/v1/dashboard/data")
+    assert resp.status_code == 200
+    return resp.json()
 
 
 @pytest.fixture
-def test_settings():
-    """Provide test settings with temporary files."""
+def aclient(app):
+    """Provide an async client that calls the shared app in-process on the test's loop.
+
+    ASGITransport holds no sockets or pool, so there is nothing to close; keeping
+    this a plain fixture avoids async-generator fixture support differences
+    across pytest-asyncio releases.
+    """
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver")
+
+
+@pytest.fixture
+def test_settings(tmp_path):
+    """Provide test settings with per-test temporary files."""
     settings = Settings(
         DEBUG=True,
         LOG_LEVEL="DEBUG",
-        REGISTRY_FILE="/tmp/test_registry.json",
-        BOTS_DIRECTORY="/tmp/test_bots",
+        REGISTRY_FILE=str(tmp_path / "registry.json"),
+        BOTS_DIRECTORY=str(tmp_path / "bots"),
     )
 
     # Create test directories
@@ -41,17 +144,7 @@ def registry(test_settings):
     # Ensure a deterministic starting point for tests.
     reg._cache = {}
     reg._save()
-    yield reg
-
-    # Cleanup
-    if os.path.exists(test_settings.REGISTRY_FILE):
-        os.remove(test_settings.REGISTRY_FILE)
-
-
-@pytest.fixture
-def executor(registry):
-    """Provide a test executor instance."""
-    return AdaptiveExecutor(registry=registry)
+    return reg
 
 
 @pytest.fixture
@@ -121,43 +214,3 @@ def test_admin_token(security_manager):
         roles=["admin"]
     )
 
-
-@pytest.fixture(autouse=True)
-def cleanup_temp_files():
-    """Clean up temporary test files after each test."""
-    yield
-
-    # Cleanup any test files
-    temp_files = [
-        "/tmp/test_registry.json",
-        "/tmp/test_bot.py",
-    ]
-
-    for filepath in temp_files:
-        if os.path.exists(filepath):
-            try:
-                os.remove(filepath)
-            except OSError:
-                pass
-
-
-# Pytest configuration
-def pytest_configure(config):
-    """Configure pytest."""
-    config.addinivalue_line(
-        "markers", "asyncio: mark test as async"
-    )
-    config.addinivalue_line(
-        "markers", "integration: mark test as integration test"
-    )
-    config.addinivalue_line(
-        "markers", "slow: mark test as slow running"
-    )
-
-
-def pytest_collection_modifyitems(config, items):
-    """Modify test collection."""
-    for item in items:
-        # Add asyncio marker to async tests
-        if "async" in item.keywords:
-            item.add_marker(pytest.mark.asyncio)
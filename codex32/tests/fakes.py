@@ -0,0 +1,53 @@
+"""In-memory stand-ins for the file-backed components, for tests that only
+exercise API or supervisor semantics and not persistence."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict
+from typing import Iterable, List
+
+from app.bot_registry import SecureRegistry
+from app.supervisor import Incident
+
+
+class InMemoryRegistry(SecureRegistry):
+    """SecureRegistry that never touches disk: starts empty, saves are no-ops."""
+
+    def __init__(self):
+        super().__init__(registry_file="<memory>")
+
+    def _load_initial_data(self) -> None:
+        self._cache = {}
+        self._recount_stats()
+
+    def _save(self) -> None:
+        pass
+
+    def reset(self) -> None:
+        """Drop every bot (quietly, unlike clear_registry)."""
+        self._load_initial_data()
+
+
+class MemoryIncidentLog:
+    """Drop-in for IncidentLog that keeps the most recent records in a deque."""
+
+    def __init__(self, maxlen: int = 1024):
+        self._buf: deque = deque(maxlen=maxlen)
+
+    def append(self, incident: Incident) -> None:
+        # IncidentLog.tail() yields decoded JSON dicts; store the same shape.
+        self._buf.append(asdict(incident))
+
+    def append_batch(self, incidents: Iterable[Incident]) -> None:
+        self._buf.extend(asdict(i) for i in incidents)
+
+    def tail(self, limit: int = 200) -> List[dict]:
+        if limit <= 0:
+            return []
+        return list(self._buf)[-limit:]
+
+    def start_batching(self) -> None:
+        pass
+
+    async def stop_batching(self) -> None:
+        pass
@@ -1,20 +1,10 @@
-from fastapi.testclient import TestClient
+def test_dashboard_data_top_level_keys(dashboard_data):
+    assert "health" in dashboard_data
+    assert "bots" in dashboard_data
+    assert "recommendations" in dashboard_data
 
-from main import create_app
 
-
-def test_dashboard_data_schema_keys():
-    app = create_app()
-    client = TestClient(app)
-
-    resp = client.get("/api/v1/dashboard/data")
-    assert resp.status_code == 200
-
-    data = resp.json()
-    # Top-level keys
-    assert "health" in data
-    assert "bots" in data
-    assert "recommendations" in data
+def test_dashboard_data_nested_keys(dashboard_data):
     # Expected nested keys used by the live dashboard
-    assert "system_health" in data["health"]
-    assert "items" in data["bots"]
+    assert "system_health" in dashboard_data["health"]
+    assert "items" in dashboard_data["bots"]
@@ -1,13 +1,20 @@
-from fastapi.testclient import TestClient
+import pytest
 
-from main import create_app
 
+@pytest.fixture(scope="module")
+def dashboard_page(client):
+    # Render once; every assertion below reads the same response.
+    return client.get("/api/v1/dashboard")
 
-def test_dashboard_page_renders():
-    app = create_app()
-    client = TestClient(app)
-    resp = client.get("/api/v1/dashboard")
-    assert resp.status_code == 200
+
+def test_dashboard_page_renders(dashboard_page):
+    assert dashboard_page.status_code == 200
     # Basic sanity checks to ensure we're serving HTML and key content exists.
-    assert "<!DOCTYPE html>" in resp.text
-    assert "Codex-32 Dashboard" in resp.text
+    assert b"<!DOCTYPE html>" in dashboard_page.content
+    assert b"Codex-32 Dashboard" in dashboard_page.content
+
+
+def test_intelligent_dashboard_is_served(client):
+    first = client.get("/api/v1/intelligent-bots/dashboard")
+    assert first.status_code == 200
+    assert client.get("/api/v1/intelligent-bots/dashboard").content == first.content
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import pytest
 
+from app import config as config_module
 from app.adaptive_executor import AdaptiveExecutor
 from app.bot_registry import SecureRegistry
 from app.models import Bot, BotDeploymentConfig, BotRole, DeploymentType
@@ -23,24 +24,23 @@ class FailingEngine:
         return True
 
 
-@pytest.mark.asyncio
-async def test_executor_falls_back_to_local_when_container_fails(tmp_path, monkeypatch):
-    # Arrange a bot whose blueprint exists
-    bots_dir = tmp_path / "bots"
-    bots_dir.mkdir()
-    bot_file = bots_dir / "ok.py"
-    # Produce some output and read an env var to ensure we pass environment vars.
-    bot_file.write_text(
-        "import os\n"
-        "print('hello')\n"
-        "print(os.environ.get('CODEX32_TEST_ENV', 'missing'))\n"
+@pytest.fixture
+def bots_dir(tmp_path, monkeypatch):
+    """A BOTS_DIRECTORY holding the `ok.py` blueprint both fallback tests run."""
+    d = tmp_path / "bots"
+    d.mkdir()
+    # Produce some output and read an env var to ensure we pass environment vars,
+    # then exit: a single write using only modules the interpreter preloads.
+    (d / "ok.py").write_text(
+        "import os, sys\n"
+        "sys.stdout.write('hello\\n' + os.environ.get('CODEX32_TEST_ENV', 'missing') + '\\n')\n"
     )
+    monkeypatch.setattr(config_module.settings, "BOTS_DIRECTORY", str(d))
+    return d
 
-    # Patch settings to point to tmp bots dir
-    from app import config as config_module
-
-    monkeypatch.setattr(config_module.settings, "BOTS_DIRECTORY", str(bots_dir))
 
+@pytest.mark.asyncio
+async def test_executor_falls_back_to_local_when_container_fails(tmp_path, bots_dir):
     registry_file = tmp_path / "registry.json"
     registry = SecureRegistry(registry_file=str(registry_file))
 
@@ -52,7 +52,8 @@ async def test_executor_falls_back_to_local_when_container_fails(tmp_path, monke
         role=BotRole.WORKER,
         deployment_config=BotDeploymentConfig(
             deployment_type=DeploymentType.CUSTOM_CONTAINER,
-            environment_vars={"CODEX32_TEST_ENV": "present"},
+            # PYTHONNOUSERSITE skips the user site-packages scan at interpreter startup.
+            environment_vars={"CODEX32_TEST_ENV": "present", "PYTHONNOUSERSITE": "1"},
         ),
     )
     registry.register_bot(bot)
@@ -83,20 +84,13 @@ class SlowStartEngine(FailingEngine):
 
     async def start_container(self, *_args, **_kwargs):
         # Simulate a hang that triggers wait_for timeout
-        await asyncio.sleep(60)
+        await asyncio.sleep(1)
 
 
 @pytest.mark.asyncio
-async def test_executor_container_start_timeout_falls_back_to_local(tmp_path, monkeypatch):
-    bots_dir = tmp_path / "bots"
-    bots_dir.mkdir()
-    bot_file = bots_dir / "ok.py"
-    bot_file.write_text("print('hello')\n")
-
-    from app import config as config_module
-
-    monkeypatch.setattr(config_module.settings, "BOTS_DIRECTORY", str(bots_dir))
-
+async def test_executor_container_start_timeout_falls_back_to_local(
+    tmp_path, bots_dir, monkeypatch
+):
     registry_file = tmp_path / "registry.json"
     registry = SecureRegistry(registry_file=str(registry_file))
 
@@ -112,6 +106,8 @@ async def test_executor_container_start_timeout_falls_back_to_local(tmp_path, mo
     )
     registry.register_bot(bot)
 
+    # Hit the timeout branch without waiting out the production limit.
+    monkeypatch.setattr(AdaptiveExecutor, "CONTAINER_START_TIMEOUT_SEC", 0.1)
     exec_ = AdaptiveExecutor(registry=registry, container_engine=SlowStartEngine())
 
     ok = await exec_.run_bot(bot)
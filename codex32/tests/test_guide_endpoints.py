@@ -1,16 +1,6 @@
-import pytest
 from fastapi.testclient import TestClient
 
 
-@pytest.fixture
-def client() -> TestClient:
-    # Importing create_app ensures we include all routers.
-    from main import create_app
-
-    app = create_app()
-    return TestClient(app)
-
-
 def test_guide_hello_exists(client: TestClient):
     r = client.get("/api/v1/guide/hello")
     assert r.status_code == 200
@@ -42,6 +32,20 @@ def test_guide_status_shape(client: TestClient):
     assert isinstance(body["bots"].get("bot_ids"), list)
 
 
+def test_guide_status_reports_running_supervisor(client_with_lifespan: TestClient):
+    r = client_with_lifespan.get("/api/v1/guide/status")
+    assert r.status_code == 200
+    supervisor = r.json()["supervisor"]
+    assert supervisor["enabled"] is True
+    assert supervisor["incidents_count"] == 0
+
+
+def test_lifespan_supervisor_writes_incidents_under_tmp_path(client_with_lifespan, tmp_path):
+    from app.supervisor import get_supervisor
+
+    assert get_supervisor().incidents.path.resolve().parent == tmp_path.resolve()
+
+
 def test_guide_recommendations_shape(client: TestClient):
     r = client.get("/api/v1/guide/recommendations")
     assert r.status_code == 200
@@ -0,0 +1,23 @@
+from app.config import settings
+
+
+def test_health_returns_prebuilt_json(client):
+    resp = client.get("/health")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json() == {
+        "status": "healthy",
+        "service": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "container_engine": "custom",
+    }
+    # Served from the same encoded bytes on every hit.
+    assert client.get("/health").content == resp.content
+
+
+def test_root_lists_entry_points(client):
+    resp = client.get("/")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["docs"] == "/docs"
+    assert body["dashboard"] == "/api/v1/dashboard"
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections import Counter
+
+from app.bot_registry import BotStatus, SecureRegistry
+
+
+def _bot(bot_id: str, status: str = "created", **extra) -> dict:
+    return {"id": bot_id, "name": f"Bot {bot_id}", "status": status, **extra}
+
+
+def _assert_stats_match_recount(registry: SecureRegistry) -> None:
+    """The incrementally maintained counters must equal a from-scratch recount."""
+    stats = registry.get_registry_stats()
+    counts = +registry._status_counts  # drop zero/negative entries
+    failed = registry._failed_count
+
+    registry._recount_stats()
+    assert +registry._status_counts == counts
+    assert registry._failed_count == failed
+    assert registry.get_registry_stats() == stats
+
+    # And the recount itself agrees with a plain scan of the bots.
+    bots = registry.get_all_bots_as_dicts()
+    assert stats["total_bots"] == len(bots)
+    assert stats["bots_by_status"] == dict(Counter(b["status"] for b in bots))
+    assert stats["active_bots"] == sum(b["status"] == "running" for b in bots)
+    assert stats["failed_bots"] == sum(
+        b["status"] in ("failed", "error") or bool(b.get("error") or b.get("error_message"))
+        for b in bots
+    )
+
+
+def test_registry_stats_track_every_mutation(tmp_path):
+    registry = SecureRegistry(registry_file=str(tmp_path / "registry.json"))
+    _assert_stats_match_recount(registry)
+
+    for i in range(4):
+        registry.register_bot(_bot(f"b{i}"))
+    _assert_stats_match_recount(registry)
+
+    registry.update_bot(_bot("b0", "running"))
+    registry.update_bot(_bot("b1", "running", error_message="flaky"))
+    _assert_stats_match_recount(registry)
+
+    registry.update_bot_status("b2", BotStatus.FAILED)
+    registry.update_bot_status("b1", BotStatus.STOPPED, error_message=None)
+    registry.update_bot_status("missing", BotStatus.RUNNING)
+    _assert_stats_match_recount(registry)
+
+    registry.update_bots([_bot("b2", "running"), _bot("b3", "error"), _bot("b0", "stopped")])
+    _assert_stats_match_recount(registry)
+
+    assert registry.unregister_bot("b3")
+    assert not registry.unregister_bot("b3")
+    _assert_stats_match_recount(registry)
+
+    backup = tmp_path / "backup.json"
+    assert registry.export_registry(str(backup))
+    registry.clear_registry()
+    _assert_stats_match_recount(registry)
+    assert registry.get_registry_stats()["total_bots"] == 0
+
+    assert registry.import_registry(str(backup))
+    _assert_stats_match_recount(registry)
+    registry.register_bot(_bot("b9", "failed"))
+    assert registry.import_registry(str(backup), merge=True)
+    _assert_stats_match_recount(registry)
+    assert registry.get_registry_stats()["total_bots"] == 4
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from app import security
+
+
+@pytest.fixture
+def counted_verify(monkeypatch):
+    """Stand in for bcrypt: count calls and accept only the password 'right'."""
+    calls = []
+
+    def fake_verify(plain: str, hashed: str) -> bool:
+        calls.append(plain)
+        return plain == "right"
+
+    monkeypatch.setattr(security.pwd_context, "verify", fake_verify)
+    monkeypatch.setattr(security, "_verify_cache", {})
+    return calls
+
+
+def test_verify_password_cache_hit_skips_bcrypt(security_manager, counted_verify):
+    assert security_manager.verify_password("right", "hash") is True
+    assert security_manager.verify_password("right", "hash") is True
+    assert counted_verify == ["right"]
+
+
+def test_verify_password_cache_entry_expires(security_manager, counted_verify, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(security.time, "monotonic", lambda: now[0])
+
+    assert security_manager.verify_password("right", "hash") is True
+    now[0] += security._VERIFY_CACHE_TTL_SEC + 1
+    assert security_manager.verify_password("right", "hash") is True
+    assert counted_verify == ["right", "right"]
+
+
+def test_verify_password_cache_does_not_admit_wrong_password(security_manager, counted_verify):
+    assert security_manager.verify_password("right", "hash") is True
+    assert security_manager.verify_password("wrong", "hash") is False
+    assert security_manager.verify_password("wrong", "hash") is False
+    assert counted_verify == ["right", "wrong"]
+
+
+def test_verify_password_cache_keys_are_keyed_macs(security_manager, counted_verify):
+    security_manager.verify_password("right", "hash")
+    unkeyed = hashlib.blake2b(b"right\0hash", digest_size=16).digest()
+    assert list(security._verify_cache) != [unkeyed]
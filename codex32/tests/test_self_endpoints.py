@@ -1,15 +1,29 @@
 from __future__ import annotations
 
-from fastapi.testclient import TestClient
+from dataclasses import asdict
+
+import pytest
 
-from main import create_app
 from app.config import settings
+from app.dependencies import get_patch_store
+from app.self_enhancement import PatchStore, propose_patch
+from app.utils import atomic_save_json
+
+_ADMIN_HEADERS = {"X-Admin-Api-Key": settings.ADMIN_API_KEY.get_secret_value()}
+
 
+@pytest.fixture
+def patch_store(app, tmp_path):
+    """Serve the patch endpoints from a store under tmp_path."""
+    store = PatchStore(str(tmp_path / "proposals.json"))
+    app.dependency_overrides[get_patch_store] = lambda: store
+    try:
+        yield store
+    finally:
+        del app.dependency_overrides[get_patch_store]
 
-def test_self_capabilities_exists():
-    app = create_app()
-    client = TestClient(app)
 
+def test_self_capabilities_exists(client):
     resp = client.get("/api/v1/self/capabilities")
     assert resp.status_code == 200
     data = resp.json()
@@ -18,24 +32,19 @@ def test_self_capabilities_exists():
     assert data["self_enhancement"]["mode"] == "proposal-and-approve"
 
 
-def test_patch_workflow_requires_admin_key():
-    app = create_app()
-    client = TestClient(app)
-
+def test_patch_workflow_requires_admin_key(client):
     resp = client.get("/api/v1/self/patches")
     assert resp.status_code == 401
 
 
-def test_patch_workflow_happy_path(tmp_path, monkeypatch):
-    # Force patch store to temp path by monkeypatching default filename via cwd
-    # We'll run in tmp_path by overriding the process working directory.
-    monkeypatch.chdir(tmp_path)
-
-    app = create_app()
-    client = TestClient(app)
+def test_list_patches_documents_an_object_response(app):
+    # The handler returns pre-serialized bytes; the schema must still say "object".
+    responses = app.openapi()["paths"]["/api/v1/self/patches"]["get"]["responses"]
+    schema = responses["200"]["content"]["application/json"]["schema"]
+    assert schema["type"] == "object"
 
-    headers = {"X-Admin-Api-Key": settings.ADMIN_API_KEY.get_secret_value()}
 
+async def test_patch_workflow_happy_path(aclient, patch_store):
     # Propose a patch
     payload = {
         "title": "Test Patch",
@@ -46,17 +55,71 @@ def test_patch_workflow_happy_path(tmp_path, monkeypatch):
         "tests": ["pytest -q"],
     }
 
-    propose = client.post("/api/v1/self/patches/propose", params=payload, headers=headers)
+    propose = await aclient.post(
+        "/api/v1/self/patches/propose", params=payload, headers=_ADMIN_HEADERS
+    )
     assert propose.status_code == 201
     proposal = propose.json()
     pid = proposal["proposal_id"]
 
+    # propose -> approve -> apply depend on each other, so they stay sequential;
+    # the async client just avoids TestClient's thread portal on each call.
     # Approve
-    approve = client.post(f"/api/v1/self/patches/{pid}/approve", headers=headers)
+    approve = await aclient.post(f"/api/v1/self/patches/{pid}/approve", headers=_ADMIN_HEADERS)
     assert approve.status_code == 200
     assert approve.json()["status"] == "approved"
 
     # Apply (logical apply gate)
-    apply = client.post(f"/api/v1/self/patches/{pid}/apply", headers=headers)
+    apply = await aclient.post(f"/api/v1/self/patches/{pid}/apply", headers=_ADMIN_HEADERS)
     assert apply.status_code == 200
     assert apply.json()["status"] == "applied"
+
+    # Every request went through the one injected store, whose index is reused.
+    index = patch_store._cache[1]
+    listing = await aclient.get("/api/v1/self/patches", headers=_ADMIN_HEADERS)
+    assert listing.json()["count"] == 1
+    assert patch_store._cache[1] is index
+    assert patch_store.get(pid).status == "applied"
+
+
+def test_patch_store_replays_events_and_compacts(tmp_path):
+    store = PatchStore(str(tmp_path / "proposals.json"))
+    p = propose_patch("T", "G", "*** Begin Patch\n*** End Patch", "r", [], [])
+    store.add(p)
+    p.status = "approved"
+    store.update(p)
+
+    # A fresh store rebuilds state from the event log alone.
+    assert PatchStore(str(tmp_path / "proposals.json")).get(p.proposal_id).status == "approved"
+
+    for _ in range(PatchStore.COMPACT_FACTOR * 2):
+        store.update(p)
+    assert (tmp_path / "proposals.json").exists()
+    assert store.events_path.stat().st_size < 1024
+    assert PatchStore(str(tmp_path / "proposals.json")).get(p.proposal_id).status == "approved"
+
+
+def test_patch_stores_in_one_directory_keep_separate_logs(tmp_path):
+    a = PatchStore(str(tmp_path / "a.json"))
+    b = PatchStore(str(tmp_path / "b.json"))
+    pa = propose_patch("A", "G", "diff", "r", [], [])
+    a.add(pa)
+
+    # Enough adds to make B compact (and truncate its own log) at least once.
+    b_ids = []
+    for i in range(PatchStore.COMPACT_FACTOR + 2):
+        p = propose_patch(f"B{i}", "G", "diff", "r", [], [])
+        b.add(p)
+        b_ids.append(p.proposal_id)
+    assert (tmp_path / "b.json").exists()
+
+    assert [p.proposal_id for p in PatchStore(str(tmp_path / "a.json")).list()] == [pa.proposal_id]
+    reloaded_b = PatchStore(str(tmp_path / "b.json"))
+    assert sorted(p.proposal_id for p in reloaded_b.list()) == sorted(b_ids)
+
+
+def test_patch_store_reads_legacy_list_snapshot(tmp_path):
+    p = propose_patch("T", "G", "diff", "r", [], [])
+    atomic_save_json(str(tmp_path / "proposals.json"), {"proposals": [asdict(p)]})
+
+    assert PatchStore(str(tmp_path / "proposals.json")).get(p.proposal_id).title == "T"
@@ -4,48 +4,230 @@ import asyncio
 
 import pytest
 
-from app.bot_registry import SecureRegistry
 from app.adaptive_executor import AdaptiveExecutor
 from app.models import Bot, BotStatus, BotDeploymentConfig, DeploymentType
-from app.supervisor import BotSupervisor, IncidentLog
+from app.supervisor import _TAIL_CHUNK_SIZE, BotSupervisor, Incident, IncidentLog
+from tests.fakes import InMemoryRegistry, MemoryIncidentLog
 
 
-@pytest.mark.asyncio
-async def test_supervisor_records_incident_on_unhealthy(tmp_path):
-    registry_file = tmp_path / "registry.json"
-    registry = SecureRegistry(registry_file=str(registry_file))
-
-    # Executor with no running processes/containers will treat RUNNING bot as unhealthy.
-    executor = AdaptiveExecutor(registry=registry)
-
-    bot = Bot(
-        id="b1",
-        name="Bot1",
-        description="",
-        blueprint="sample_bot.py",
-        role="worker",
-        status=BotStatus.RUNNING,
-        deployment_config=BotDeploymentConfig(
-            deployment_type=DeploymentType.LOCAL_PROCESS,
-            cpu_request="100m",
-            cpu_limit="500m",
-            memory_request="128Mi",
-            memory_limit="512Mi",
-            environment_vars={},
-            extra_config={},
-        ),
-        error_count=0,
-        performance={},
-        logs=[],
-    )
-    registry.register_bot(bot)
+@pytest.fixture(scope="module")
+def ticked_supervisor():
+    """Run one supervisor tick over a RUNNING-but-dead bot; tests share the outcome."""
 
-    log = IncidentLog(path=str(tmp_path / "incidents.jsonl"))
-    supervisor = BotSupervisor(registry=registry, executor=executor, incident_log=log, interval_sec=1, max_failures=1)
+    async def _tick():
+        registry = InMemoryRegistry()
+
+        # Executor with no running processes/containers will treat RUNNING bot as unhealthy.
+        executor = AdaptiveExecutor(registry=registry)
+
+        bot = Bot(
+            id="b1",
+            name="Bot1",
+            description="",
+            blueprint="sample_bot.py",
+            role="worker",
+            status=BotStatus.RUNNING,
+            deployment_config=BotDeploymentConfig(
+                deployment_type=DeploymentType.LOCAL_PROCESS,
+                cpu_request="100m",
+                cpu_limit="500m",
+                memory_request="128Mi",
+                memory_limit="512Mi",
+                environment_vars={},
+                extra_config={},
+            ),
+            error_count=0,
+            performance={},
+            logs=[],
+        )
+        registry.register_bot(bot)
+
+        log = MemoryIncidentLog()
+        supervisor = BotSupervisor(
+            registry=registry,
+            executor=executor,
+            incident_log=log,
+            interval_sec=1,
+            max_failures=1,
+        )
+        await supervisor.tick()
+        return supervisor, log
+
+    return asyncio.run(_tick())
 
-    # Single tick should attempt repair and record at least one incident.
-    await supervisor.tick()
 
+def test_supervisor_records_incident_on_unhealthy(ticked_supervisor):
+    _, log = ticked_supervisor
+    # A single tick should attempt repair and record at least one incident.
     incidents = log.tail(limit=50)
     assert len(incidents) >= 1
     assert incidents[0]["bot_id"] == "b1"
+
+
+def test_supervisor_incidents_share_one_timestamp_per_tick(ticked_supervisor):
+    _, log = ticked_supervisor
+    incidents = log.tail(limit=50)
+    assert incidents[0]["kind"] == "unhealthy"
+    assert len({rec["created_at"] for rec in incidents}) == 1
+
+
+@pytest.mark.asyncio
+async def test_incident_log_batching_flushes_on_stop(tmp_path):
+    log = IncidentLog(path=str(tmp_path / "incidents.jsonl"), batch_size=4)
+    log.start_batching()
+
+    for i in range(10):
+        log.append(
+            Incident(incident_id=f"inc-{i}", bot_id="b1", bot_name="Bot1", kind="test", message="m")
+        )
+    await log.stop_batching()
+
+    # Appends after stopping are written synchronously again.
+    log.append(
+        Incident(incident_id="inc-sync", bot_id="b1", bot_name="Bot1", kind="test", message="m")
+    )
+
+    ids = [rec["incident_id"] for rec in log.tail(limit=50)]
+    assert ids == [f"inc-{i}" for i in range(10)] + ["inc-sync"]
+
+
+def test_incident_log_append_batch_writes_in_order(tmp_path):
+    log = IncidentLog(path=str(tmp_path / "incidents.jsonl"))
+    log.append_batch(
+        Incident(incident_id=f"inc-{i}", bot_id="b1", bot_name="Bot1", kind="test", message="m")
+        for i in range(5)
+    )
+    log.append_batch([])
+
+    assert [rec["incident_id"] for rec in log.tail(limit=50)] == [f"inc-{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("limit", [1, 7, 500, 1500, 5000])
+def test_incident_log_read_last_lines_matches_readlines_across_chunks(tmp_path, limit):
+    # Over two 64 KiB chunks of uneven lines, so reads split lines mid-way.
+    path = tmp_path / "big.jsonl"
+    path.write_bytes(b"".join(b"%d:" % i + b"x" * (i * 37 % 300) + b"\n" for i in range(2000)))
+    data = path.read_bytes()
+    assert len(data) > 2 * _TAIL_CHUNK_SIZE
+    for k in (1, 2):
+        boundary = len(data) - k * _TAIL_CHUNK_SIZE
+        assert data[boundary - 1 : boundary] != b"\n"
+
+    with path.open("rb") as f:
+        expected = [line.rstrip(b"\n") for line in f.readlines()[-limit:]]
+    with path.open("rb") as f:
+        assert IncidentLog._read_last_lines(f, limit) == expected
+
+
+class _DeadExecutor:
+    """Executor stand-in whose bots are never running and never restart."""
+
+    running_containers: dict = {}
+
+    async def stop_bot(self, bot_id, reason=""):
+        return True
+
+    async def run_bot(self, bot):
+        return False
+
+
+def _spy_registry_writes(registry, monkeypatch):
+    calls = []
+    update_bots, update_bot = registry.update_bots, registry.update_bot
+
+    def _update_bots(bots):
+        calls.append(("update_bots", [b["id"] for b in bots]))
+        return update_bots(bots)
+
+    def _update_bot(bot):
+        calls.append(("update_bot", bot["id"]))
+        return update_bot(bot)
+
+    monkeypatch.setattr(registry, "update_bots", _update_bots)
+    monkeypatch.setattr(registry, "update_bot", _update_bot)
+    return calls
+
+
+def _running_registry(*bot_ids):
+    registry = InMemoryRegistry()
+    for bot_id in bot_ids:
+        registry.register_bot({"id": bot_id, "name": bot_id, "status": "running"})
+    return registry
+
+
+def test_supervisor_quarantines_in_one_batched_write(monkeypatch):
+    registry = _running_registry("b1", "b2")
+    calls = _spy_registry_writes(registry, monkeypatch)
+    log = MemoryIncidentLog()
+    supervisor = BotSupervisor(
+        registry=registry, executor=_DeadExecutor(), incident_log=log, max_failures=2
+    )
+
+    async def _ticks(n):
+        for _ in range(n):
+            await supervisor.tick()
+            # Skip the restart backoff so every tick counts as another failure.
+            for st in supervisor._restart_state.values():
+                st.next_allowed_at = None
+
+    asyncio.run(_ticks(2))
+    assert calls == []
+    assert {b["status"] for b in registry.get_all_bots_as_dicts()} == {"running"}
+
+    asyncio.run(_ticks(1))
+    assert calls == [("update_bots", ["b1", "b2"])]
+    assert {b["status"] for b in registry.get_all_bots_as_dicts()} == {"error"}
+    assert [rec["kind"] for rec in log.tail(limit=50)][-2:] == ["quarantined", "quarantined"]
+
+
+def test_supervisor_persists_quarantines_when_a_later_bot_fails(monkeypatch):
+    registry = _running_registry("b1", "b2")
+    calls = _spy_registry_writes(registry, monkeypatch)
+    supervisor = BotSupervisor(
+        registry=registry,
+        executor=_DeadExecutor(),
+        incident_log=MemoryIncidentLog(),
+        max_failures=1,
+    )
+    supervisor._get_restart_state("b1").failures = 1
+
+    handle_unhealthy = supervisor._handle_unhealthy
+
+    async def _handle(bot, *args):
+        if bot["id"] == "b2":
+            raise RuntimeError("boom")
+        await handle_unhealthy(bot, *args)
+
+    monkeypatch.setattr(supervisor, "_handle_unhealthy", _handle)
+    with pytest.raises(RuntimeError):
+        asyncio.run(supervisor.tick())
+
+    # The tick's finally still flushed b1's quarantine.
+    assert calls == [("update_bots", ["b1"])]
+    assert registry.get_bot_by_id("b1").status == "error"
+
+
+def test_supervisor_skips_quarantine_of_bot_deleted_mid_tick(monkeypatch):
+    registry = _running_registry("b1", "b2", "b3")
+    calls = _spy_registry_writes(registry, monkeypatch)
+    supervisor = BotSupervisor(
+        registry=registry,
+        executor=_DeadExecutor(),
+        incident_log=MemoryIncidentLog(),
+        max_failures=1,
+    )
+    # b1 and b3 are quarantined this tick; b2 is healed in between.
+    supervisor._get_restart_state("b1").failures = 1
+    supervisor._get_restart_state("b3").failures = 1
+
+    async def _stop_bot(bot_id, reason=""):
+        # b1 is deleted through the API while the tick awaits b2's stop.
+        registry.unregister_bot("b1")
+        return True
+
+    monkeypatch.setattr(supervisor.executor, "stop_bot", _stop_bot)
+    asyncio.run(supervisor.tick())
+
+    assert calls == [("update_bots", ["b3"])]
+    assert registry.get_bot_by_id("b1") is None
+    assert registry.get_bot_by_id("b3").status == "error"
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from app.utils import AtomicFileWriter, json_dumps, json_loads
+
+
+def test_atomic_file_writer_binary_mode_writes_bytes(tmp_path):
+    target = tmp_path / "out.json"
+    with AtomicFileWriter(str(target), binary=True) as f:
+        f.write(json_dumps({"a": 1}))
+    assert json_loads(target.read_bytes()) == {"a": 1}
+
+
+def test_atomic_file_writer_leaves_target_untouched_on_error(tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("old")
+    with pytest.raises(RuntimeError):
+        with AtomicFileWriter(str(target)) as f:
+            f.write("new")
+            raise RuntimeError("boom")
+    assert target.read_text() == "old"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_json_dumps_accepts_non_string_keys():
+    # Same output on the orjson and stdlib paths: keys are stringified.
+    assert json_loads(json_dumps({1: "a", "b": {2: None}})) == {"1": "a", "b": {"2": None}}
@@ -0,0 +1,96 @@
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from app.routers import ws as ws_module
+
+
+def test_ws_command_echoes_text_frame_as_text(client):
+    with client.websocket_connect("/ws/command/alice") as ws:
+        ws.send_text('{"cmd": "status", "args": [1, 2]}')
+        body = json.loads(ws.receive_text())
+
+    assert body["type"] == "echo"
+    assert body["user_id"] == "alice"
+    assert body["payload"] == {"cmd": "status", "args": [1, 2]}
+    assert body["ts"]
+
+
+def test_ws_command_echoes_bytes_frame_as_bytes(client):
+    with client.websocket_connect("/ws/command/alice") as ws:
+        ws.send_bytes(b'  [1, {"k": "v"}]')
+        body = json.loads(ws.receive_bytes())
+
+    assert body["type"] == "echo"
+    assert body["payload"] == [1, {"k": "v"}]
+
+
+@pytest.mark.parametrize("raw", ["hello bot", "{not json", "[1, 2"])
+def test_ws_command_wraps_non_json_text_frame(client, raw):
+    with client.websocket_connect("/ws/command/alice") as ws:
+        ws.send_text(raw)
+        body = json.loads(ws.receive_text())
+
+    assert body["payload"] == {"message": raw}
+
+
+def test_ws_command_wraps_non_json_bytes_frame(client):
+    with client.websocket_connect("/ws/command/alice") as ws:
+        ws.send_bytes(b"{oops \xff")
+        body = json.loads(ws.receive_bytes())
+
+    assert body["payload"] == {"message": "{oops \ufffd"}
+
+
+@pytest.fixture
+def fast_heartbeats(monkeypatch):
+    monkeypatch.setattr(ws_module, "HEARTBEAT_INTERVAL_SEC", 0.01)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def _wait_for_broadcaster():
+    # Fail fast instead of blocking forever in receive_text() if no broadcaster runs.
+    _wait_for(lambda: ws_module._broadcaster is not None and not ws_module._broadcaster.done())
+
+
+def test_ws_updates_sends_immediate_then_broadcast_heartbeat(client, fast_heartbeats):
+    with client.websocket_connect("/ws/updates") as ws:
+        first = ws.receive_text()
+        _wait_for_broadcaster()
+        broadcast = ws.receive_text()
+        assert len(ws_module._clients) == 1
+
+    # Heartbeats are spliced into a pre-serialized template; both must be valid JSON.
+    for raw in (first, broadcast):
+        msg = json.loads(raw)
+        assert msg.keys() == {"type", "ts"}
+        assert msg["type"] == "heartbeat"
+        assert datetime.fromisoformat(msg["ts"].replace("Z", "+00:00")).tzinfo is not None
+    assert not ws_module._clients
+
+
+def test_ws_updates_restarts_broadcaster_after_last_client_leaves(
+    client_with_lifespan, fast_heartbeats
+):
+    # One TestClient context, so both connections share the app's event loop.
+    with client_with_lifespan.websocket_connect("/ws/updates") as ws:
+        ws.receive_text()
+        _wait_for_broadcaster()
+        ws.receive_text()
+    _wait_for(lambda: not ws_module._clients)
+    # With no clients left the broadcaster exits on its next wake-up.
+    _wait_for(lambda: ws_module._broadcaster.done())
+
+    with client_with_lifespan.websocket_connect("/ws/updates") as ws:
+        ws.receive_text()
+        _wait_for_broadcaster()
+        assert ws.receive_text().startswith('{"type":"heartbeat"')
+    _wait_for(lambda: not ws_module._clients)